@@ -2,28 +2,97 @@
 from __future__ import annotations
 
 import logging
+import time
+from collections.abc import Callable
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform, CONF_DEVICE, CONF_HOST, CONF_PORT, CONF_SCAN_INTERVAL
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import ConfigEntryError, ConfigEntryNotReady
+from homeassistant.helpers import config_validation as cv, device_registry as dr
+from homeassistant.helpers.event import async_track_time_interval
+from homeassistant.helpers.typing import ConfigType
 
-from pyarcamsolo import ArcamSolo
+from .capture import CapturingArcamSolo, FrameCaptureWriter
+from .const import (
+    DOMAIN,
+    CAPTURE_BACKUP_COUNT,
+    CAPTURE_FLUSH_INTERVAL,
+    CAPTURE_MAX_BYTES,
+    CONF_CAPTURE_FRAMES,
+    CONF_ENABLED_FEATURES,
+    CONF_HEARTBEAT_TIMEOUT,
+    CONF_ZONE_EVENTS,
+    DATA_STREAM_SEQ,
+    DEFAULT_CONF_ENABLED_FEATURES,
+    DEFAULT_CONF_HEARTBEAT_TIMEOUT,
+    DEFAULT_CONF_SCAN_INTERVAL
+)
+from .delivery import ArcamCommandDelivery
+from .device import device_identifier
+from .models import ArcamSoloData
+from .stream import ArcamZoneStream
+from .transport import async_get_transport_registry
+from .watchdog import ArcamLinkWatchdog
+from .websocket_api import async_register_websocket_commands
 
-from .const import DOMAIN, DEFAULT_CONF_SCAN_INTERVAL
+if TYPE_CHECKING:
+    from pyarcamsolo import ArcamSolo
 
 _LOGGER = logging.getLogger(__name__)
-PLATFORMS: list[Platform] = [Platform.MEDIA_PLAYER, Platform.REMOTE, Platform.NUMBER, Platform.BUTTON]
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
+PLATFORMS: list[Platform] = [
+    Platform.MEDIA_PLAYER,
+    Platform.REMOTE,
+    Platform.NUMBER,
+    Platform.BUTTON,
+    Platform.SENSOR
+]
+
+# Features that need a platform, platforms without an entry are always loaded
+PLATFORM_FEATURES: dict[Platform, list[str]] = {
+    Platform.REMOTE: ["virtual_remote"],
+    Platform.NUMBER: ["sound_controls", "display_controls", "radio_controls"],
+    Platform.BUTTON: ["virtual_buttons"],
+    Platform.SENSOR: ["listening_statistics"]
+}
+
+def get_platforms(entry: ConfigEntry) -> list[Platform]:
+    """Return the platforms needed by the enabled features of an entry."""
+    features = entry.data.get(CONF_ENABLED_FEATURES, DEFAULT_CONF_ENABLED_FEATURES)
+    return [
+        platform for platform in PLATFORMS
+        if platform not in PLATFORM_FEATURES
+        or any(feature in features for feature in PLATFORM_FEATURES[platform])
+    ]
+
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    """Set up the Arcam Solo websocket API."""
+    async_register_websocket_commands(hass)
+    return True
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up this integration using UI."""
     hass.data.setdefault(DOMAIN, {})
-    arcam = ArcamSolo(
-        uri=entry.data[CONF_DEVICE],
-        scan_interval=entry.data.get(CONF_SCAN_INTERVAL, DEFAULT_CONF_SCAN_INTERVAL)
-    )
+    started = time.monotonic()
+    uri = entry.data[CONF_DEVICE]
+    transports = async_get_transport_registry(hass)
+    capture = None
+    if entry.data.get(CONF_CAPTURE_FRAMES, False):
+        capture = FrameCaptureWriter(
+            hass.config.path(DOMAIN, f"{entry.entry_id}.cap"),
+            CAPTURE_MAX_BYTES,
+            CAPTURE_BACKUP_COUNT
+        )
     try:
-        await arcam.connect()
+        arcam = await transports.async_acquire(
+            uri,
+            scan_interval=entry.data.get(CONF_SCAN_INTERVAL, DEFAULT_CONF_SCAN_INTERVAL),
+            entry_id=entry.entry_id,
+            capture=capture
+        )
     except (
         TimeoutError,
         ConnectionAbortedError,
@@ -32,30 +101,120 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         RuntimeError,
         OSError
     ) as exc:
-        if arcam:
-            await arcam.shutdown()
-            del arcam
         raise ConfigEntryNotReady from exc
     except Exception as exc:
         raise ConfigEntryError from exc
-    hass.data[DOMAIN][entry.entry_id] = arcam
+    watchdog = stream = None
+    try:
+        if isinstance(arcam, CapturingArcamSolo):
+            _async_setup_capture_flush(hass, entry, arcam.capture)
+        watchdog = ArcamLinkWatchdog(
+            hass,
+            entry.entry_id,
+            arcam,
+            entry.data.get(CONF_HEARTBEAT_TIMEOUT, DEFAULT_CONF_HEARTBEAT_TIMEOUT),
+            connect=lambda: transports.async_connect(uri, arcam)
+        )
+        watchdog.async_start()
+        stream = ArcamZoneStream(hass, entry.entry_id, arcam, entry.data.get(CONF_ZONE_EVENTS, False))
+        stream.async_start()
+        data = ArcamSoloData(
+            amp=arcam,
+            watchdog=watchdog,
+            stream=stream,
+            delivery=ArcamCommandDelivery(arcam)
+        )
+        data.setup_timings["connect"] = time.monotonic() - started
+        hass.data[DOMAIN][entry.entry_id] = data
 
-    # setup platforms
-    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+        # setup platforms
+        started = time.monotonic()
+        await hass.config_entries.async_forward_entry_setups(entry, get_platforms(entry))
+        entry.async_on_unload(_async_track_software_version(hass, entry, arcam))
+        data.setup_timings["platforms"] = time.monotonic() - started
+    except Exception:
+        # Hand the connection back so a retry can pick it up again
+        if watchdog is not None:
+            watchdog.async_stop()
+        if stream is not None:
+            stream.async_stop()
+        hass.data[DOMAIN].pop(entry.entry_id, None)
+        transports.async_park(entry.entry_id, uri)
+        raise
+    _LOGGER.debug(
+        "Setup timings for %s: connect %.3fs, platforms %.3fs",
+        entry.title,
+        data.setup_timings["connect"],
+        data.setup_timings["platforms"]
+    )
 
     return True
 
+@callback
+def _async_setup_capture_flush(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    capture: FrameCaptureWriter
+) -> None:
+    """Write captured frames to disk periodically and on unload."""
+    async def _async_flush(_now: datetime | None = None) -> None:
+        await hass.async_add_executor_job(capture.flush)
+
+    entry.async_on_unload(
+        async_track_time_interval(
+            hass,
+            _async_flush,
+            timedelta(seconds=CAPTURE_FLUSH_INTERVAL),
+            cancel_on_shutdown=True
+        )
+    )
+    entry.async_on_unload(_async_flush)
+
+@callback
+def _async_track_software_version(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    arcam: ArcamSolo
+) -> Callable[[], None]:
+    """Push software version changes reported by the amp to the device registry."""
+    identifier = device_identifier(entry)
+    reported = None
+
+    @callback
+    def _async_zone_updated() -> None:
+        nonlocal reported
+        version = arcam.zones.get(1, {}).get("software_version")
+        if version is None or version == reported:
+            return
+        reported = version
+        device_registry = dr.async_get(hass)
+        device = device_registry.async_get_device(identifiers={(DOMAIN, identifier)})
+        if device is not None and device.sw_version != version:
+            device_registry.async_update_device(device.id, sw_version=version)
+
+    callback_id = arcam.set_zone_callback(zone=1, callback=_async_zone_updated)
+    _async_zone_updated()
+    return lambda: arcam.set_zone_callback(zone=1, callback_id=callback_id)
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a entry."""
-    arcam: ArcamSolo = hass.data[DOMAIN][entry.entry_id]
-    unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
-    await arcam.shutdown()
+    data: ArcamSoloData = hass.data[DOMAIN][entry.entry_id]
+    unload_ok = await hass.config_entries.async_unload_platforms(entry, get_platforms(entry))
     if unload_ok:
+        data.watchdog.async_stop()
+        data.stream.async_stop()
+        # Keep the connection briefly in case this is a reload
+        async_get_transport_registry(hass).async_park(entry.entry_id, entry.data[CONF_DEVICE])
         hass.data[DOMAIN].pop(entry.entry_id)
     else:
         _LOGGER.warning("unload_entry failed.")
     return unload_ok
 
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Close the connection of a removed entry without waiting for it to expire."""
+    await async_get_transport_registry(hass).async_discard(entry.entry_id)
+    hass.data.get(DATA_STREAM_SEQ, {}).pop(entry.entry_id, None)
+
 async def async_migrate_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Migrate config entry to latest version."""
     if entry.version == 1:
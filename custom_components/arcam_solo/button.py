@@ -4,30 +4,115 @@ from __future__ import annotations
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.components.button import ButtonEntity
-from homeassistant.core import HomeAssistant
+from homeassistant.const import Platform
+from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.helpers import device_registry as dr, entity_registry as er
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from pyarcamsolo import ArcamSolo
+from homeassistant.helpers.event import async_track_entity_registry_updated_event
 
-from .const import DOMAIN, COMMAND_BUTTONS, CONF_ENABLED_FEATURES, DEFAULT_CONF_ENABLED_FEATURES
-from .device import ArcamSoloDevice
+from pyarcamsolo.commands import IR_COMMAND_CODES
+
+from .const import (
+    DOMAIN,
+    COMMAND_BUTTONS,
+    CONF_ENABLED_FEATURES,
+    DEFAULT_CONF_ENABLED_FEATURES,
+    IR_BUTTON_ACRONYMS,
+    IR_BUTTON_GROUPS
+)
+from .device import ArcamSoloDevice, device_info
+from .models import ArcamSoloData
+
+def ir_command_buttons() -> list[dict]:
+    """Return a disabled by default button for every IR command of the library."""
+    covered = {conf["ir_command"] for conf in COMMAND_BUTTONS}
+    buttons = []
+    for command in IR_COMMAND_CODES:
+        if command in covered:
+            continue
+        group, icon = "Remote", "mdi:remote"
+        rest = command
+        for prefix, (prefix_group, prefix_icon) in IR_BUTTON_GROUPS.items():
+            if command.startswith(prefix):
+                group, icon = prefix_group, prefix_icon
+                if prefix.endswith("_"):
+                    rest = command.removeprefix(prefix)
+                break
+        label = " ".join(IR_BUTTON_ACRONYMS.get(word, word.capitalize()) for word in rest.split("_"))
+        buttons.append({
+            "name": f"{group} {label}",
+            "unique_id": f"ir-{command.replace('_', '-')}",
+            "icon": icon,
+            "ir_command": command,
+            "enabled_default": False
+        })
+    return buttons
+
+def button_unique_id(entry_id: str, zone: int, btn_config: dict) -> str:
+    """Return the unique id of a button on a zone."""
+    return f"{entry_id}-{zone}-button-{btn_config['unique_id']}"
 
 async def async_setup_entry(
         hass: HomeAssistant,
         config_entry: ConfigEntry,
         async_add_entities: AddEntitiesCallback
 ) -> None:
-    """Set up the Arcam Solo remote."""
-    if "virtual_buttons" in config_entry.data.get(CONF_ENABLED_FEATURES, DEFAULT_CONF_ENABLED_FEATURES):
-        arcam = hass.data[DOMAIN][config_entry.entry_id]
-        entities = []
-        for conf in COMMAND_BUTTONS:
-            entities.append(ArcamCommandButton(
-                amp=arcam,
+    """Set up the Arcam Solo buttons.
+
+    Catalogue buttons are written to the entity registry disabled and are
+    only created once enabled, so unused commands cost no entity objects,
+    callbacks or states. An enabled button is created straight away, Home
+    Assistant still reloads the entry about 30 seconds later as it does for
+    any entity enabled in the registry.
+    """
+    if "virtual_buttons" not in config_entry.data.get(CONF_ENABLED_FEATURES, DEFAULT_CONF_ENABLED_FEATURES):
+        return
+    data: ArcamSoloData = hass.data[DOMAIN][config_entry.entry_id]
+    registry = er.async_get(hass)
+    device = dr.async_get(hass).async_get_or_create(
+        config_entry_id=config_entry.entry_id,
+        **device_info(config_entry, data.amp)
+    )
+    zone = 1 # multi-zone not supported yet
+    entities = []
+    catalogue: dict[str, dict] = {}
+    for conf in COMMAND_BUTTONS + ir_command_buttons():
+        unique_id = button_unique_id(config_entry.entry_id, zone, conf)
+        entity_id = registry.async_get_entity_id(Platform.BUTTON, DOMAIN, unique_id)
+        if entity_id is None and not conf.get("enabled_default", True):
+            entity_id = registry.async_get_or_create(
+                Platform.BUTTON,
+                DOMAIN,
+                unique_id,
                 config_entry=config_entry,
-                zone=1,
-                btn_config=conf
-            ))
-        async_add_entities(entities)
+                device_id=device.id,
+                suggested_object_id=f"{device.name} {conf['name']}",
+                disabled_by=er.RegistryEntryDisabler.INTEGRATION,
+                has_entity_name=True,
+                original_name=conf["name"],
+                original_icon=conf["icon"]
+            ).entity_id
+        if entity_id is not None:
+            catalogue[entity_id] = conf
+            if registry.async_get(entity_id).disabled:
+                continue
+        entities.append(ArcamCommandButton(data, config_entry, zone, conf))
+    async_add_entities(entities)
+
+    @callback
+    def _async_registry_updated(event: Event) -> None:
+        """Create a catalogue button as soon as it is enabled."""
+        if event.data["action"] != "update" or "disabled_by" not in event.data["changes"]:
+            return
+        entry = registry.async_get(event.data["entity_id"])
+        if entry is not None and not entry.disabled:
+            async_add_entities([
+                ArcamCommandButton(data, config_entry, zone, catalogue[entry.entity_id])
+            ])
+
+    config_entry.async_on_unload(
+        async_track_entity_registry_updated_event(hass, list(catalogue), _async_registry_updated)
+    )
 
 class ArcamCommandButton(ArcamSoloDevice, ButtonEntity):
     """Represents a command button."""
@@ -35,20 +120,25 @@ class ArcamCommandButton(ArcamSoloDevice, ButtonEntity):
     _attr_has_entity_name = True
 
     def __init__(self,
-                 amp: ArcamSolo,
+                 data: ArcamSoloData,
                  config_entry: ConfigEntry,
                  zone: int,
                  btn_config: dict) -> None:
         """Initialize the Arcam Solo."""
-        super().__init__(amp, config_entry, zone)
+        super().__init__(data, config_entry, zone)
         self._attr_name = btn_config["name"]
         self._attr_icon = btn_config["icon"]
-        self._attr_unique_id = f"{self.config_entry.entry_id}-{self.zone}-button-{btn_config['unique_id']}"
+        self._attr_unique_id = button_unique_id(self.config_entry.entry_id, self.zone, btn_config)
         self._ir_command = btn_config["ir_command"]
 
     @property
     def available(self) -> bool:
         """Return if the entity is currently available."""
+        if not super().available:
+            return False
+        if self._ir_command.startswith("standby"):
+            # Power commands must work while the amp is in standby
+            return True
         state = self.amp.zones.get(self.zone)
         if state is None:
             return False
@@ -60,4 +150,4 @@ class ArcamCommandButton(ArcamSoloDevice, ButtonEntity):
 
     async def async_press(self) -> None:
         """Handle button press."""
-        await self.amp.send_ir_command(command=self._ir_command)
+        await self.data.delivery.async_send_ir(self._ir_command)
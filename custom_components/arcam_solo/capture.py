@@ -0,0 +1,171 @@
+"""Frame capture for Arcam Solo connections.
+
+A capture file starts with a header of the magic bytes, a format version
+and the capture start time. Each frame follows as a record of the
+milliseconds since the start, the direction, the frame length and the
+raw frame bytes.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import struct
+import time
+from collections.abc import Iterator
+from typing import Any
+
+from pyarcamsolo import ArcamSolo
+
+_LOGGER = logging.getLogger(__name__)
+
+MAGIC = b"ARCAMCAP"
+VERSION = 1
+HEADER = struct.Struct("<8sBd")  # magic, version, start time (unix)
+RECORD = struct.Struct("<IBH")  # ms since start, direction, length
+MAX_OFFSET = 0xFFFFFFFF
+
+DIRECTION_IN = 0  # amp -> Home Assistant
+DIRECTION_OUT = 1  # Home Assistant -> amp
+
+class FrameCaptureWriter:
+    """Append frames to a capture file, rotating it by size.
+
+    record() only buffers so it is safe to call from the event loop,
+    flush() does the file I/O and must run in an executor.
+    """
+
+    def __init__(self, path: str, max_bytes: int, backup_count: int) -> None:
+        """Initialize the writer."""
+        self.path = path
+        self.max_bytes = max_bytes
+        self.backup_count = backup_count
+        self._buffer: list[tuple[float, int, bytes]] = []
+
+    def record(self, direction: int, frame: bytes) -> None:
+        """Buffer a frame."""
+        self._buffer.append((time.time(), direction, bytes(frame)))
+
+    def flush(self) -> None:
+        """Write buffered frames to disk."""
+        if not self._buffer:
+            return
+        frames, self._buffer = self._buffer, []
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        capture = None
+        start = 0.0
+        try:
+            for timestamp, direction, frame in frames:
+                if (
+                    capture is None
+                    or capture.tell() >= self.max_bytes
+                    or (timestamp - start) * 1000 > MAX_OFFSET
+                ):
+                    if capture is not None:
+                        capture.close()
+                        self._rotate()
+                    capture, start = self._open()
+                offset = max(0, int((timestamp - start) * 1000))
+                capture.write(RECORD.pack(offset, direction, len(frame)))
+                capture.write(frame)
+        finally:
+            if capture is not None:
+                capture.close()
+
+    def _open(self) -> tuple[Any, float]:
+        """Open the capture file for appending, return it with its start time."""
+        if os.path.exists(self.path) and os.path.getsize(self.path) >= HEADER.size:
+            with open(self.path, "rb") as existing:
+                _, _, start = HEADER.unpack(existing.read(HEADER.size))
+            return open(self.path, "ab"), start
+        start = time.time()
+        capture = open(self.path, "wb")
+        capture.write(HEADER.pack(MAGIC, VERSION, start))
+        return capture, start
+
+    def _rotate(self) -> None:
+        """Shift capture.N to capture.N+1 and start a new file."""
+        for index in range(self.backup_count - 1, 0, -1):
+            source = f"{self.path}.{index}"
+            if os.path.exists(source):
+                os.replace(source, f"{self.path}.{index + 1}")
+        if self.backup_count > 0:
+            os.replace(self.path, f"{self.path}.1")
+        else:
+            os.remove(self.path)
+
+def read_capture(path: str) -> Iterator[tuple[float, int, bytes]]:
+    """Yield (unix time, direction, frame) for each record of a capture file."""
+    with open(path, "rb") as capture:
+        magic, version, start = HEADER.unpack(capture.read(HEADER.size))
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{path} is not a version {VERSION} Arcam capture")
+        while header := capture.read(RECORD.size):
+            if len(header) < RECORD.size:
+                _LOGGER.warning("Ignoring truncated record at the end of %s", path)
+                return
+            offset, direction, length = RECORD.unpack(header)
+            frame = capture.read(length)
+            if len(frame) < length:
+                _LOGGER.warning("Ignoring truncated record at the end of %s", path)
+                return
+            yield start + offset / 1000, direction, frame
+
+class _CapturingReader:
+    """Stream reader proxy that records frames read from the amp."""
+
+    def __init__(self, reader: Any, capture: FrameCaptureWriter) -> None:
+        self._reader = reader
+        self._capture = capture
+
+    async def readuntil(self, separator: bytes) -> bytes:
+        """Read a frame and record it."""
+        frame = await self._reader.readuntil(separator)
+        self._capture.record(DIRECTION_IN, frame)
+        return frame
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._reader, name)
+
+class _CapturingWriter:
+    """Stream writer proxy that records frames written to the amp."""
+
+    def __init__(self, writer: Any, capture: FrameCaptureWriter) -> None:
+        self._writer = writer
+        self._capture = capture
+
+    def write(self, data: bytes) -> None:
+        """Record a frame and write it."""
+        self._capture.record(DIRECTION_OUT, data)
+        self._writer.write(data)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._writer, name)
+
+class CapturingArcamSolo(ArcamSolo):
+    """ArcamSolo that records the frames of its connection.
+
+    The library replaces its reader and writer on every (re)connect so
+    they are wrapped as they are assigned.
+    """
+
+    def __init__(self, *args: Any, capture: FrameCaptureWriter, **kwargs: Any) -> None:
+        """Initialize the capturing connection."""
+        self.capture = capture
+        super().__init__(*args, **kwargs)
+
+    @property
+    def _reader(self) -> Any:
+        return self.__reader
+
+    @_reader.setter
+    def _reader(self, reader: Any) -> None:
+        self.__reader = None if reader is None else _CapturingReader(reader, self.capture)
+
+    @property
+    def _writer(self) -> Any:
+        return self.__writer
+
+    @_writer.setter
+    def _writer(self, writer: Any) -> None:
+        self.__writer = None if writer is None else _CapturingWriter(writer, self.capture)
@@ -8,7 +8,18 @@ from homeassistant import config_entries
 from homeassistant.const import CONF_DEVICE, CONF_NAME
 from homeassistant.helpers import selector
 
-from .const import DOMAIN, CONF_ENABLED_FEATURES, DEFAULT_CONF_ENABLED_FEATURES
+from .const import (
+    DOMAIN,
+    CONF_CAPTURE_FRAMES,
+    CONF_ENABLED_FEATURES,
+    CONF_HEARTBEAT_TIMEOUT,
+    CONF_POSITION_UPDATE_INTERVAL,
+    CONF_ZONE_EVENTS,
+    DEFAULT_CONF_ENABLED_FEATURES,
+    DEFAULT_CONF_HEARTBEAT_TIMEOUT,
+    DEFAULT_CONF_POSITION_UPDATE_INTERVAL,
+    ENABLED_FEATURES_OPTIONS
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -49,11 +60,41 @@ class ArcamSoloFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
                         default=(user_input or {}).get(CONF_ENABLED_FEATURES, DEFAULT_CONF_ENABLED_FEATURES)
                     ): selector.SelectSelector(
                         selector.SelectSelectorConfig(
-                            options=DEFAULT_CONF_ENABLED_FEATURES,
+                            options=ENABLED_FEATURES_OPTIONS,
                             multiple=True,
                             mode=selector.SelectSelectorMode.DROPDOWN
                         )
-                    )
+                    ),
+                    vol.Optional(
+                        CONF_POSITION_UPDATE_INTERVAL,
+                        default=(user_input or {}).get(CONF_POSITION_UPDATE_INTERVAL, DEFAULT_CONF_POSITION_UPDATE_INTERVAL)
+                    ): selector.NumberSelector(
+                        selector.NumberSelectorConfig(
+                            min=0,
+                            max=300,
+                            unit_of_measurement="s",
+                            mode=selector.NumberSelectorMode.BOX
+                        )
+                    ),
+                    vol.Optional(
+                        CONF_HEARTBEAT_TIMEOUT,
+                        default=(user_input or {}).get(CONF_HEARTBEAT_TIMEOUT, DEFAULT_CONF_HEARTBEAT_TIMEOUT)
+                    ): selector.NumberSelector(
+                        selector.NumberSelectorConfig(
+                            min=10,
+                            max=600,
+                            unit_of_measurement="s",
+                            mode=selector.NumberSelectorMode.BOX
+                        )
+                    ),
+                    vol.Optional(
+                        CONF_ZONE_EVENTS,
+                        default=(user_input or {}).get(CONF_ZONE_EVENTS, False)
+                    ): selector.BooleanSelector(),
+                    vol.Optional(
+                        CONF_CAPTURE_FRAMES,
+                        default=(user_input or {}).get(CONF_CAPTURE_FRAMES, False)
+                    ): selector.BooleanSelector()
                 }
             ),
             errors=_errors
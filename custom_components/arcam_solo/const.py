@@ -13,7 +13,58 @@ COMMAND_BUTTONS = [
     }
 ]
 
+# IR command prefix -> (button group, icon) for the disabled by default catalogue,
+# prefixes ending in an underscore are dropped from the button name
+IR_BUTTON_GROUPS = {
+    "src_": ("Source", "mdi:import"),
+    "standby": ("Power", "mdi:power"),
+    "mute": ("Volume", "mdi:volume-mute"),
+    "volume_": ("Volume", "mdi:volume-high"),
+    "bass": ("Sound", "mdi:tune-vertical"),
+    "treble": ("Sound", "mdi:tune-vertical"),
+    "balance": ("Sound", "mdi:tune-vertical"),
+    "navigate_": ("Navigation", "mdi:remote"),
+    "menu": ("Navigation", "mdi:menu"),
+    "ok": ("Navigation", "mdi:check"),
+    "alarm_": ("Alarm", "mdi:alarm"),
+    "snooze": ("Alarm", "mdi:alarm-snooze"),
+    "sleep": ("Alarm", "mdi:sleep"),
+    "cd_": ("CD", "mdi:disc-player"),
+    "display_": ("Display", "mdi:brightness-6")
+}
+IR_BUTTON_ACRONYMS = {"tv": "TV", "av": "AV", "dab": "DAB", "usb": "USB", "am": "AM", "fm": "FM", "aux": "AUX", "cd": "CD"}
+
 DEFAULT_CONF_SCAN_INTERVAL = 1800 # Every 30 mins
+CONF_POSITION_UPDATE_INTERVAL = "position_update_interval"
+DEFAULT_CONF_POSITION_UPDATE_INTERVAL = 0 # Only on play / pause / seek / track change
+CONF_HEARTBEAT_TIMEOUT = "heartbeat_timeout"
+DEFAULT_CONF_HEARTBEAT_TIMEOUT = 60
+AVAILABILITY_GRACE = 30 # Seconds a link can be down before entities go unavailable
+GROUP_COMMAND_TIMEOUT = 5 # Seconds each group member has to complete a command
+# Command class -> delivery policy. Idempotent commands set an absolute value,
+# they are confirmed against the zone state and resent if the amp does not
+# report it within timeout seconds. Other commands (toggles, steps, IR keys)
+# are only sent once. No class may take longer than its deadline.
+COMMAND_POLICIES = {
+    "power": {"timeout": 1.5, "retries": 2, "deadline": 4.5, "idempotent": True},
+    "source": {"timeout": 1.5, "retries": 2, "deadline": 4.5, "idempotent": True},
+    "level": {"timeout": 1.0, "retries": 2, "deadline": 4.0, "idempotent": True},
+    "mute": {"timeout": 1.0, "retries": 2, "deadline": 4.0, "idempotent": True},
+    "toggle": {"timeout": 1.0, "retries": 0, "deadline": 2.0, "idempotent": False}
+}
+SIGNAL_GROUP_UPDATED = f"{DOMAIN}_group_updated"
+DATA_TRANSPORTS = f"{DOMAIN}_transports"
+CONNECT_SPACING = 1.0 # Seconds between connection attempts to one host
+MAX_CONCURRENT_CONNECTS = 4 # Connections to one host being established at once
+PARK_TIMEOUT = 30 # Seconds an unloaded entry's connection is kept for a reload
+CONF_ZONE_EVENTS = "zone_events"
+EVENT_ZONE_CHANGED = f"{DOMAIN}_zone_changed"
+DATA_STREAM_SEQ = f"{DOMAIN}_stream_seq"
+ZONE_DISCOVERY_INTERVAL = 30 # Seconds between checks for zones that appeared later
+CONF_CAPTURE_FRAMES = "capture_frames"
+CAPTURE_MAX_BYTES = 5 * 1024 * 1024
+CAPTURE_BACKUP_COUNT = 3
+CAPTURE_FLUSH_INTERVAL = 5
 CONF_ENABLED_FEATURES = "enabled_features"
 CONF_ENABLED_BUTTONS = "enabled_buttons"
 
@@ -24,3 +75,5 @@ DEFAULT_CONF_ENABLED_FEATURES = [
     "radio_controls",
     "virtual_buttons"
 ]
+# Features that can be enabled, listening statistics are opt in
+ENABLED_FEATURES_OPTIONS = [*DEFAULT_CONF_ENABLED_FEATURES, "listening_statistics"]
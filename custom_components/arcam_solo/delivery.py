@@ -0,0 +1,193 @@
+"""Command delivery for Arcam Solo."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections.abc import Awaitable, Callable
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.exceptions import HomeAssistantError
+
+from .const import COMMAND_POLICIES
+
+if TYPE_CHECKING:
+    from pyarcamsolo import ArcamSolo
+
+_LOGGER = logging.getLogger(__name__)
+
+# Queries the library sends to have the amp report a value again
+QUERY_DATA = [b'\xF0']
+
+class ArcamCommandDelivery:
+    """Send commands with the deadline and retry policy of their class.
+
+    A command that sets an absolute value is confirmed by waiting for the
+    amp to report it. When no report arrives in time the value is queried
+    first, as the acknowledgement may be what was lost, and the command is
+    only resent when the query does not confirm it either.
+    """
+
+    def __init__(self, amp: ArcamSolo, zone: int = 1) -> None:
+        """Initialize command delivery."""
+        self.amp = amp
+        self.zone = zone
+        self.metrics: dict[str, dict[str, Any]] = {
+            command_class: {
+                "commands": 0,
+                "confirmed": 0,
+                "unconfirmed": 0,
+                "retries": 0,
+                "timeouts": 0,
+                "failed": 0,
+                "last_latency": None,
+                "max_latency": None
+            }
+            for command_class in COMMAND_POLICIES
+        }
+
+    async def async_turn_on(self) -> None:
+        """Turn the amp on."""
+        await self.async_send(
+            "power", self.amp.turn_on, "power", lambda power: power not in (None, "Standby"), "status"
+        )
+
+    async def async_turn_off(self) -> None:
+        """Turn the amp off."""
+        await self.async_send(
+            "power", self.amp.turn_off, "power", lambda power: power == "Standby", "status"
+        )
+
+    async def async_set_source(self, source: str) -> None:
+        """Select an input source."""
+        await self.async_send(
+            "source", lambda: self.amp.set_source(source), "source", lambda value: value == source, "source"
+        )
+
+    async def async_set_volume(self, volume: int) -> None:
+        """Set an absolute volume (0-72)."""
+        await self.async_send(
+            "level", lambda: self.amp.set_volume(volume), "volume", lambda value: value == volume, "volume"
+        )
+
+    async def async_set_mute(self, mute: bool) -> None:
+        """Mute or unmute."""
+        await self.async_send(
+            "mute",
+            lambda: self.amp.send_ir_command(command="mute_on" if mute else "mute_off"),
+            "muted",
+            lambda value: value == mute,
+            "mute"
+        )
+
+    async def async_set_level(self, command: str, data: list[bytes], key: str, value: Any) -> None:
+        """Set a level such as bass or display brightness, confirmed by the reported key."""
+        await self.async_send(
+            "level",
+            lambda: self.amp.send_raw_command(command=command, data=data, zone=self.zone),
+            key,
+            lambda reported: reported == value,
+            command
+        )
+
+    async def async_send_ir(self, command: str) -> None:
+        """Send an IR key once."""
+        await self.async_send("toggle", lambda: self.amp.send_ir_command(command=command))
+
+    async def async_send(
+            self,
+            command_class: str,
+            send: Callable[[], Awaitable[None]],
+            key: str | None = None,
+            confirmed: Callable[[Any], bool] | None = None,
+            query: str | None = None) -> None:
+        """Deliver a command, raising HomeAssistantError if it could not be."""
+        policy = COMMAND_POLICIES[command_class]
+        metrics = self.metrics[command_class]
+        metrics["commands"] += 1
+        if not policy["idempotent"]:
+            key = confirmed = None
+        started = time.monotonic()
+        deadline = started + policy["deadline"]
+        attempt = 0
+        while True:
+            attempt += 1
+            try:
+                await asyncio.wait_for(send(), max(deadline - time.monotonic(), 0))
+            except TimeoutError:
+                metrics["timeouts"] += 1
+            except (RuntimeError, OSError, ValueError) as err:
+                # ValueError is an IR command the library does not know
+                metrics["failed"] += 1
+                raise HomeAssistantError(f"Unable to send command: {err}") from err
+            else:
+                if key is None or confirmed is None:
+                    metrics["unconfirmed"] += 1
+                    break
+                if await self._async_confirm(key, confirmed, query, policy["timeout"], deadline):
+                    metrics["confirmed"] += 1
+                    break
+            if attempt > policy["retries"] or time.monotonic() >= deadline:
+                metrics["failed"] += 1
+                self._record_latency(metrics, started)
+                raise HomeAssistantError(
+                    f"Arcam Solo did not confirm {command_class} command after {attempt} attempt(s)"
+                )
+            metrics["retries"] += 1
+            _LOGGER.debug("Resending %s command, attempt %s", command_class, attempt + 1)
+        self._record_latency(metrics, started)
+
+    async def _async_confirm(
+            self,
+            key: str,
+            confirmed: Callable[[Any], bool],
+            query: str | None,
+            timeout: float,
+            deadline: float) -> bool:
+        """Wait for the zone to report a value, querying it once if it does not."""
+        if await self._async_wait_for(key, confirmed, min(timeout, deadline - time.monotonic())):
+            return True
+        if query is None or time.monotonic() >= deadline:
+            return False
+        try:
+            await asyncio.wait_for(
+                self.amp.send_raw_command(command=query, data=QUERY_DATA, zone=self.zone),
+                max(deadline - time.monotonic(), 0)
+            )
+        except (TimeoutError, RuntimeError, OSError):
+            return False
+        return await self._async_wait_for(key, confirmed, min(timeout, deadline - time.monotonic()))
+
+    async def _async_wait_for(self, key: str, confirmed: Callable[[Any], bool], timeout: float) -> bool:
+        """Wait until a zone key holds a confirmed value."""
+        state = self.amp.zones.get(self.zone)
+        if state is not None and confirmed(state.get(key)):
+            return True
+        if timeout <= 0:
+            return False
+        reported = asyncio.Event()
+
+        def _zone_updated() -> None:
+            if confirmed(self.amp.zones.get(self.zone, {}).get(key)):
+                reported.set()
+
+        callback_id = self.amp.set_zone_callback(zone=self.zone, callback=_zone_updated)
+        if callback_id is None:
+            # Zone not discovered yet, nothing to confirm against
+            return True
+        try:
+            await asyncio.wait_for(reported.wait(), timeout)
+        except TimeoutError:
+            return False
+        finally:
+            self.amp.set_zone_callback(zone=self.zone, callback_id=callback_id)
+        return True
+
+    @staticmethod
+    def _record_latency(metrics: dict[str, Any], started: float) -> None:
+        """Record how long a command took to deliver."""
+        latency = round(time.monotonic() - started, 3)
+        metrics["last_latency"] = latency
+        if metrics["max_latency"] is None or latency > metrics["max_latency"]:
+            metrics["max_latency"] = latency
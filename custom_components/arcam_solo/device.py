@@ -1,50 +1,90 @@
 """Represent an Arcam device."""
 
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity import Entity
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import CONF_HOST, CONF_PORT, CONF_NAME
-
-from pyarcamsolo import ArcamSolo
+from homeassistant.const import CONF_DEVICE, CONF_HOST, CONF_PORT, CONF_NAME
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 
 from .const import DOMAIN
 
+POSITION_KEY = "current_track_position"
+
+if TYPE_CHECKING:
+    from pyarcamsolo import ArcamSolo
+
+    from .models import ArcamSoloData
+
+def device_identifier(config_entry: ConfigEntry) -> str:
+    """Return the device registry identifier for a config entry."""
+    if CONF_HOST in config_entry.data:
+        # Entries migrated from version 1 keep their original identifier
+        return f"{config_entry.data[CONF_HOST]}:{config_entry.data[CONF_PORT]}"
+    return config_entry.data[CONF_DEVICE]
+
+def device_info(config_entry: ConfigEntry, amp: ArcamSolo) -> DeviceInfo:
+    """Return the device registry information for a config entry."""
+    return DeviceInfo(
+        identifiers={(DOMAIN, device_identifier(config_entry))},
+        name=config_entry.data[CONF_NAME],
+        model="Solo",
+        sw_version=amp.zones.get(1, {}).get("software_version"),
+        manufacturer="Arcam"
+    )
+
 class ArcamSoloDevice(Entity):
     """Represent a Arcam entity."""
 
     _attr_should_poll = False
     _attr_has_entity_name = True
 
-    def __init__(self, amp: ArcamSolo, config_entry: ConfigEntry, zone: int) -> None:
+    def __init__(self, data: ArcamSoloData, config_entry: ConfigEntry, zone: int) -> None:
         """Initialize a ArcamSoloDevice."""
-        self.amp: ArcamSolo = amp
+        self.data = data
+        self.amp: ArcamSolo = data.amp
         self.zone = zone
         self.config_entry: ConfigEntry = config_entry
         self.zone_callback_id = None
+        self._last_position = None
+        self._attr_device_info = device_info(config_entry, self.amp)
 
     async def async_added_to_hass(self) -> None:
         """Handle common setup and zone callback."""
-        def callback_update_ha() -> None:
-            self.schedule_update_ha_state()
-
         self._added_to_hass = True
-        self.zone_callback_id = self.amp.set_zone_callback(zone=self.zone, callback=callback_update_ha)
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return information about the device."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, f"{self.config_entry.data[CONF_HOST]}:{self.config_entry.data[CONF_PORT]}")},
-            name=self.config_entry.data[CONF_NAME],
-            model="Solo",
-            sw_version=self.amp.software_version,
-            manufacturer="Arcam"
+        self.zone_callback_id = self.amp.set_zone_callback(zone=self.zone, callback=self._handle_zone_update)
+        if self.zone_callback_id is not None:
+            self.async_on_remove(self._remove_zone_callback)
+        self.async_on_remove(
+            async_dispatcher_connect(self.hass, self.data.watchdog.signal, self.async_write_ha_state)
         )
 
+    def _remove_zone_callback(self) -> None:
+        """Stop receiving zone updates, the amp may outlive this entity."""
+        self.amp.set_zone_callback(zone=self.zone, callback_id=self.zone_callback_id)
+        self.zone_callback_id = None
+
+    def _handle_zone_update(self) -> None:
+        """Handle a zone update from the amp, skipping CD / USB position ticks."""
+        position = self.amp.zones.get(self.zone, {}).get(POSITION_KEY)
+        if position != self._last_position:
+            # The library calls back once per key, so a moved position is a tick
+            self._last_position = position
+            if not self._position_needs_write(position):
+                return
+        self.schedule_update_ha_state()
+
+    def _position_needs_write(self, position: int | None) -> bool:
+        """Return if a position tick should be written, only the media player shows it."""
+        return False
+
     @property
     def available(self) -> bool:
         """Return whether this device is available."""
-        return self.amp.available
+        return self.data.watchdog.available
 
     @property
     def source(self) -> str | None:
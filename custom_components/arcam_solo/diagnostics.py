@@ -0,0 +1,42 @@
+"""Diagnostics support for Arcam Solo."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.components.diagnostics import REDACTED, async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import CONF_DEVICE, CONF_HOST
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN
+from .models import ArcamSoloData
+from .transport import async_get_transport_registry, transport_host
+
+TO_REDACT = {CONF_DEVICE, CONF_HOST}
+
+async def async_get_config_entry_diagnostics(
+        hass: HomeAssistant,
+        entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    host = transport_host(entry.data[CONF_DEVICE])
+    diagnostics = {
+        "entry": async_redact_data(dict(entry.data), TO_REDACT),
+        "transport": {
+            **async_get_transport_registry(hass).async_host_state(host),
+            "host": REDACTED
+        }
+    }
+    data: ArcamSoloData | None = hass.data.get(DOMAIN, {}).get(entry.entry_id)
+    if data is None:
+        # The entry is not loaded, only the stored config is available
+        return diagnostics
+    return {
+        **diagnostics,
+        "available": data.amp.available,
+        "watchdog_available": data.watchdog.available,
+        "zones": data.amp.zones,
+        "setup_timings": data.setup_timings,
+        "commands": data.delivery.metrics
+    }
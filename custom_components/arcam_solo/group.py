@@ -0,0 +1,83 @@
+"""Player grouping for Arcam Solo."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable
+from typing import TYPE_CHECKING
+
+from homeassistant.const import Platform
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import entity_registry as er
+
+from .const import DOMAIN, GROUP_COMMAND_TIMEOUT
+
+if TYPE_CHECKING:
+    from .models import ArcamSoloData
+
+_LOGGER = logging.getLogger(__name__)
+
+@callback
+def async_get_member_data(hass: HomeAssistant, entity_id: str) -> ArcamSoloData | None:
+    """Return the runtime data of an Arcam Solo media player entity."""
+    entry = er.async_get(hass).async_get(entity_id)
+    if (
+        entry is None
+        or entry.platform != DOMAIN
+        or entry.domain != Platform.MEDIA_PLAYER
+        or entry.config_entry_id is None
+    ):
+        return None
+    return hass.data.get(DOMAIN, {}).get(entry.config_entry_id)
+
+@callback
+def async_leave_group(hass: HomeAssistant, entity_id: str) -> None:
+    """Remove a player from its group, dissolving groups left with one player."""
+    data = async_get_member_data(hass, entity_id)
+    if data is None or not data.group_members:
+        return
+    group = data.group_members
+    if entity_id in group:
+        group.remove(entity_id)
+    data.group_members = []
+    if len(group) == 1:
+        last = async_get_member_data(hass, group[0])
+        if last is not None:
+            last.group_members = []
+        group.clear()
+
+async def async_fan_out(
+        hass: HomeAssistant,
+        members: list[str],
+        command: Callable[[ArcamSoloData], Awaitable[None]]
+) -> dict[str, BaseException | None]:
+    """Run a command against every group member concurrently.
+
+    Each member is given GROUP_COMMAND_TIMEOUT seconds so a slow amp does
+    not hold up the others, the exception (or None) is returned per member.
+    """
+    targets = {
+        entity_id: data
+        for entity_id in members
+        if (data := async_get_member_data(hass, entity_id)) is not None
+    }
+    results = await asyncio.gather(
+        *(
+            asyncio.wait_for(command(data), GROUP_COMMAND_TIMEOUT)
+            for data in targets.values()
+        ),
+        return_exceptions=True
+    )
+    outcome: dict[str, BaseException | None] = {}
+    for entity_id, result in zip(targets, results):
+        if isinstance(result, BaseException):
+            _LOGGER.warning(
+                "Group command failed for %s: %s",
+                entity_id,
+                str(result) or type(result).__name__
+            )
+            outcome[entity_id] = result
+        else:
+            outcome[entity_id] = None
+    return outcome
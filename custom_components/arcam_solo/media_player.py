@@ -1,13 +1,15 @@
 """Media player entity for Arcam Solo."""
 
+import logging
 from typing import Any
 
-from pyarcamsolo import ArcamSolo
 from pyarcamsolo.commands import SOURCE_SELECTION_CODES
 
 from homeassistant.core import HomeAssistant
 from homeassistant.const import STATE_UNKNOWN, CONF_NAME
 from homeassistant.components.media_player import (
+    BrowseMedia,
+    MediaClass,
     MediaPlayerEntity,
     MediaPlayerEntityFeature,
     MediaPlayerState,
@@ -15,15 +17,42 @@ from homeassistant.components.media_player import (
     MediaType,
     RepeatMode,
 )
-from homeassistant.exceptions import ServiceValidationError
+from homeassistant.exceptions import HomeAssistantError, ServiceValidationError
+from homeassistant.helpers.dispatcher import async_dispatcher_connect, async_dispatcher_send
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.util import datetime
-from .const import DOMAIN
-from .device import ArcamSoloDevice
+from homeassistant.util import dt as dt_util
+from .const import (
+    DOMAIN,
+    CONF_POSITION_UPDATE_INTERVAL,
+    DEFAULT_CONF_POSITION_UPDATE_INTERVAL,
+    SIGNAL_GROUP_UPDATED
+)
+from .device import POSITION_KEY, ArcamSoloDevice
+from .group import async_fan_out, async_get_member_data, async_leave_group
+from .models import ArcamSoloData
+from .stations import ArcamStationIndex, MAX_FOREGROUND_PRESSES, SCANNABLE_BANDS, STATION_KEYS
+
+_LOGGER = logging.getLogger(__name__)
 
 PARALLEL_UPDATES = 0
 
+MEDIA_TYPE_SCAN = "scan"
+
+# Position difference (s) from the interpolated value treated as a seek.
+POSITION_SEEK_THRESHOLD = 2
+# Seconds without a position tick after which the next one is a resume.
+POSITION_TICK_GAP = 3
+
+def _station_title(band: str, station: Any) -> str:
+    """Return the display title of a station."""
+    if band == "AM":
+        return f"{station} kHz"
+    if band == "FM":
+        return f"{station} MHz"
+    return str(station)
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -31,13 +60,17 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ):
     """Set up the Arcam Solo media_player."""
-    arcam: ArcamSolo = hass.data[DOMAIN][config_entry.entry_id]
+    data: ArcamSoloData = hass.data[DOMAIN][config_entry.entry_id]
+    stations = ArcamStationIndex(hass, config_entry.entry_id)
+    await stations.async_load()
+    config_entry.async_on_unload(stations.async_save)
     async_add_entities(
         [
             ArcamMediaEntity(
-                amp=arcam,
+                data=data,
                 config_entry=config_entry,
-                zone=1 # multi-zone not supported yet
+                zone=1, # multi-zone not supported yet
+                stations=stations
             )
         ]
     )
@@ -50,26 +83,110 @@ class ArcamMediaEntity(ArcamSoloDevice, MediaPlayerEntity):
     _attr_has_entity_name = True
     _attr_name = None # https://developers.home-assistant.io/docs/core/entity#entity-naming
 
-    # def __init__(
-    #     self,
-    #     config_entry: ConfigEntry,
-    #     arcam: ArcamSolo,
-    #     name: str,
-    #     dev_unique_id: str,
-    #     zone: int = 1,
-    # ) -> None:
-    #     """Initialize the Arcam Solo."""
-    #     self._config_entry = config_entry
-    #     self._device_unique_id = dev_unique_id
-    #     self._arcam = arcam
-    #     self._attr_name = name
-    #     self._added_to_hass = False
-    #     self._zone = zone
-
-    @property
-    def unique_id(self) -> str:
-        """Return the unique id."""
-        return f"{self.config_entry.entry_id}-{self.zone}-media_player"
+    def __init__(
+        self,
+        data: ArcamSoloData,
+        config_entry: ConfigEntry,
+        zone: int,
+        stations: ArcamStationIndex
+    ) -> None:
+        """Initialize the Arcam Solo."""
+        super().__init__(data, config_entry, zone)
+        self._attr_unique_id = f"{config_entry.entry_id}-{zone}-media_player"
+        self._stations = stations
+        self._position_update_interval = config_entry.data.get(
+            CONF_POSITION_UPDATE_INTERVAL, DEFAULT_CONF_POSITION_UPDATE_INTERVAL
+        )
+        self._position: int | None = None
+        self._position_updated_at: datetime | None = None
+        self._tuner_source: str | None = None
+        self._playback: str | None = None
+        self._ticking = False
+        self._tick_position: int | None = None
+        self._tick_at: datetime | None = None
+
+    async def async_added_to_hass(self) -> None:
+        """Handle zone callback and group updates."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            async_dispatcher_connect(self.hass, SIGNAL_GROUP_UPDATED, self.async_write_ha_state)
+        )
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Leave any group when removed."""
+        async_leave_group(self.hass, self.entity_id)
+        async_dispatcher_send(self.hass, SIGNAL_GROUP_UPDATED)
+
+    def _handle_zone_update(self) -> None:
+        """Record the tuned station and handle the update."""
+        state = self.amp.zones.get(self.zone, {})
+        source = state.get("source")
+        if source != self._tuner_source:
+            self._tuner_source = source
+            if source in STATION_KEYS:
+                # The tuned station is stale until queried on the new band
+                self.config_entry.async_create_background_task(
+                    self.hass,
+                    self._async_refresh_station(source),
+                    f"{DOMAIN}_{self.config_entry.entry_id}_station_refresh"
+                )
+        if self._stations.observe(state):
+            self._stations.async_schedule_save()
+        playback = state.get("cd_playback_state")
+        if playback != self._playback:
+            # Interpolation restarts from here, not from before a pause
+            self._playback = playback
+            self._position = state.get(POSITION_KEY)
+            self._position_updated_at = dt_util.utcnow()
+        super()._handle_zone_update()
+
+    async def _async_refresh_station(self, band: str) -> None:
+        """Query the tuned station after a source change."""
+        try:
+            await self._stations.async_refresh(self.data.delivery, self.zone, band)
+        except HomeAssistantError as err:
+            _LOGGER.debug("Unable to query the %s station: %s", band, err)
+
+    async def _async_tune_in_background(self, band: str, station: Any) -> None:
+        """Tune a station that needs a long walk of presses."""
+        try:
+            tuned = await self._stations.async_tune(self.data.delivery, self.zone, band, station)
+        except HomeAssistantError as err:
+            _LOGGER.warning("Stopped tuning to %s: %s", station, err)
+            return
+        if not tuned:
+            _LOGGER.warning("Unable to tune to %s", station)
+
+    def _position_needs_write(self, position: int | None) -> bool:
+        """Return if a position tick should be written to the state machine."""
+        now = dt_util.utcnow()
+        previous, previous_at = self._tick_position, self._tick_at
+        self._tick_position, self._tick_at = position, now
+        # Playing is told from steady +1 ticks, the library reports no USB playback state
+        ticking = (
+            previous is not None
+            and position is not None
+            and 0 < position - previous <= POSITION_SEEK_THRESHOLD
+        )
+        resumed = ticking and (now - previous_at).total_seconds() > POSITION_TICK_GAP
+        if (
+            ticking == self._ticking
+            and not resumed
+            and self._position is not None
+            and position is not None
+            and self._position_updated_at is not None
+        ):
+            elapsed = (now - self._position_updated_at).total_seconds()
+            expected = self._position + elapsed if ticking else self._position
+            if (
+                abs(position - expected) <= POSITION_SEEK_THRESHOLD
+                and not (self._position_update_interval and elapsed >= self._position_update_interval)
+            ):
+                return False
+        self._ticking = ticking
+        self._position = position
+        self._position_updated_at = now
+        return True
 
     @property
     def state(self) -> MediaPlayerState:
@@ -104,7 +221,7 @@ class ArcamMediaEntity(ArcamSoloDevice, MediaPlayerEntity):
     @property
     def available(self) -> bool:
         """Returns if the device is available."""
-        return self.amp.available and self.zone in self.amp.zones
+        return super().available and self.zone in self.amp.zones
 
     @property
     def volume_level(self) -> float:
@@ -128,6 +245,9 @@ class ArcamMediaEntity(ArcamSoloDevice, MediaPlayerEntity):
         features |= MediaPlayerEntityFeature.VOLUME_SET
         features |= MediaPlayerEntityFeature.VOLUME_STEP
         features |= MediaPlayerEntityFeature.SELECT_SOURCE
+        features |= MediaPlayerEntityFeature.BROWSE_MEDIA
+        features |= MediaPlayerEntityFeature.PLAY_MEDIA
+        features |= MediaPlayerEntityFeature.GROUPING
         if self.source in ("CD", "USB"):
             features |= MediaPlayerEntityFeature.PLAY
             features |= MediaPlayerEntityFeature.PAUSE
@@ -163,14 +283,14 @@ class ArcamMediaEntity(ArcamSoloDevice, MediaPlayerEntity):
     def media_position(self) -> int | None:
         """Position of media currently playing in seconds."""
         if self.source in ("CD", "USB"):
-            return self.amp.zones[self.zone].get("current_track_position", None)
+            return self._position
         return None
 
     @property
     def media_position_updated_at(self) -> datetime | None:
         """Return the time the media position was updated."""
         if self.source in ("CD", "USB"):
-            return datetime.now()
+            return self._position_updated_at
         return None
 
     @property
@@ -228,6 +348,11 @@ class ArcamMediaEntity(ArcamSoloDevice, MediaPlayerEntity):
 
         return None
 
+    @property
+    def group_members(self) -> list[str] | None:
+        """Return the players grouped with this one, leader first."""
+        return self.data.group_members or None
+
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return extra state attributes."""
@@ -235,92 +360,200 @@ class ArcamMediaEntity(ArcamSoloDevice, MediaPlayerEntity):
 
     async def async_turn_on(self) -> None:
         """Turn the player on."""
-        return await self.amp.turn_on()
+        return await self._async_group_call(lambda data: data.delivery.async_turn_on())
 
     async def async_turn_off(self) -> None:
         """Turn the player off."""
-        return await self.amp.turn_off()
+        return await self._async_group_call(lambda data: data.delivery.async_turn_off())
 
     async def async_select_source(self, source: str) -> None:
         """Select input source."""
-        return await self.amp.set_source(source)
+        return await self._async_group_call(lambda data: data.delivery.async_set_source(source))
 
     async def async_volume_up(self) -> None:
         """Volume up media player."""
-        return await self.amp.send_ir_command(command="volume_plus")
+        return await self._async_group_call(lambda data: data.delivery.async_send_ir("volume_plus"))
 
     async def async_volume_down(self) -> None:
         """Volume down media player."""
-        return await self.amp.send_ir_command(command="volume_minus")
+        return await self._async_group_call(lambda data: data.delivery.async_send_ir("volume_minus"))
 
     async def async_set_volume_level(self, volume) -> None:
         """Set volume level."""
         max_vol = 72
-        return await self.amp.set_volume(round(volume * max_vol))
+        return await self._async_group_call(lambda data: data.delivery.async_set_volume(round(volume * max_vol)))
 
     async def async_mute_volume(self, mute: bool) -> None:
         """Mute or unmute media player."""
-        if mute:
-            return await self.amp.send_ir_command(command="mute_on")
-        else:
-            return await self.amp.send_ir_command(command="mute_off")
+        return await self._async_group_call(lambda data: data.delivery.async_set_mute(mute))
 
     async def async_media_play(self) -> None:
         """Send play command."""
         if self.source not in ("CD", "USB"):
             raise ServiceValidationError("Current source does not support this action")
-        return await self.amp.send_ir_command(command="cd_play")
+        return await self.data.delivery.async_send_ir("cd_play")
 
     async def async_media_pause(self) -> None:
         """Send pause command."""
         if self.source not in ("CD", "USB"):
             raise ServiceValidationError("Current source does not support this action")
-        return await self.amp.send_ir_command(command="cd_pause")
+        return await self.data.delivery.async_send_ir("cd_pause")
 
     async def async_media_stop(self) -> None:
         """Send stop command."""
         if self.source not in ("CD", "USB"):
             raise ServiceValidationError("Current source does not support this action")
-        return await self.amp.send_ir_command(command="cd_stop")
+        return await self.data.delivery.async_send_ir("cd_stop")
 
     async def async_media_previous_track(self) -> None:
         """Send previous track command."""
         if self.source not in ("CD", "USB", "DAB", "AM", "FM"):
             raise ServiceValidationError("Current source does not support this action")
         if self.source in ("DAB", "AM", "FM"):
-            return await self.amp.send_ir_command(command="navigate_down")
-        return await self.amp.send_ir_command(command="cd_track_previous")
+            return await self.data.delivery.async_send_ir("navigate_down")
+        return await self.data.delivery.async_send_ir("cd_track_previous")
 
     async def async_media_next_track(self) -> None:
         """Send previous track command."""
         if self.source not in ("CD", "USB", "DAB", "AM", "FM"):
             raise ServiceValidationError("Current source does not support this action")
         if self.source in ("DAB", "AM", "FM"):
-            return await self.amp.send_ir_command(command="navigate_up")
-        return await self.amp.send_ir_command(command="cd_track_next")
+            return await self.data.delivery.async_send_ir("navigate_up")
+        return await self.data.delivery.async_send_ir("cd_track_next")
 
     async def async_set_repeat(self, repeat: RepeatMode) -> None:
         """Set repeat mode."""
         if repeat == RepeatMode.ALL:
-            return await self.amp.send_ir_command(
-                command="cd_repeat_all"
-            )
+            return await self.data.delivery.async_send_ir("cd_repeat_all")
         if repeat == RepeatMode.ONE:
-            return await self.amp.send_ir_command(
-                command="cd_repeat_single"
-            )
+            return await self.data.delivery.async_send_ir("cd_repeat_single")
         if repeat == RepeatMode.OFF:
-            return await self.amp.send_ir_command(
-                command="cd_repeat_off"
-            )
+            return await self.data.delivery.async_send_ir("cd_repeat_off")
 
     async def async_set_shuffle(self, shuffle: bool) -> None:
         """Set shuffle mode."""
         if shuffle:
-            return await self.amp.send_ir_command(
-                command="cd_shuffle_on"
+            return await self.data.delivery.async_send_ir("cd_shuffle_on")
+        else:
+            return await self.data.delivery.async_send_ir("cd_shuffle_off")
+
+    async def async_browse_media(
+        self,
+        media_content_type: MediaType | str | None = None,
+        media_content_id: str | None = None,
+    ) -> BrowseMedia:
+        """Browse the radio station index."""
+        if media_content_id in STATION_KEYS:
+            return self._browse_band(media_content_id)
+        return BrowseMedia(
+            media_class=MediaClass.DIRECTORY,
+            media_content_id="",
+            media_content_type="",
+            title="Radio",
+            can_play=False,
+            can_expand=True,
+            children=[self._browse_band(band) for band in STATION_KEYS],
+            children_media_class=MediaClass.DIRECTORY
+        )
+
+    def _browse_band(self, band: str) -> BrowseMedia:
+        """Return the stations known for a radio band."""
+        children = [
+            BrowseMedia(
+                media_class=MediaClass.CHANNEL,
+                media_content_id=f"{band}/{station}",
+                media_content_type=MediaType.CHANNEL,
+                title=_station_title(band, station),
+                can_play=True,
+                can_expand=False
             )
+            for station in self._stations.stations(band)
+        ]
+        if band in SCANNABLE_BANDS:
+            children.append(
+                BrowseMedia(
+                    media_class=MediaClass.APP,
+                    media_content_id=f"{MEDIA_TYPE_SCAN}/{band}",
+                    media_content_type=MEDIA_TYPE_SCAN,
+                    title="Scan for stations",
+                    can_play=True,
+                    can_expand=False
+                )
+            )
+        return BrowseMedia(
+            media_class=MediaClass.DIRECTORY,
+            media_content_id=band,
+            media_content_type="",
+            title=band,
+            can_play=False,
+            can_expand=True,
+            children=children
+        )
+
+    async def async_play_media(
+        self, media_type: MediaType | str, media_id: str, **kwargs: Any
+    ) -> None:
+        """Tune to a station from the station index."""
+        band, _, station_id = media_id.partition("/")
+        if band == MEDIA_TYPE_SCAN:
+            band = station_id
+            station = None
         else:
-            return await self.amp.send_ir_command(
-                command="cd_shuffle_off"
+            station = self._stations.lookup(band, station_id)
+            if station is None:
+                raise ServiceValidationError(f"Unknown station {media_id}")
+        if band not in STATION_KEYS:
+            raise ServiceValidationError(f"Unknown radio band {band}")
+        if self.state == MediaPlayerState.OFF:
+            raise ServiceValidationError("Device must be turned on to tune a station")
+        if self.source != band:
+            await self.data.delivery.async_set_source(band)
+        if station is None:
+            self.config_entry.async_create_background_task(
+                self.hass,
+                self._stations.async_scan(self.data.delivery, self.zone, band),
+                f"{DOMAIN}_{self.config_entry.entry_id}_station_scan"
+            )
+            return
+        current = await self._stations.async_refresh(self.data.delivery, self.zone, band)
+        step = self._stations.path(band, current, station)
+        if step is None:
+            raise ServiceValidationError(f"Unable to tune to {station}")
+        if step[1] > MAX_FOREGROUND_PRESSES:
+            self.config_entry.async_create_background_task(
+                self.hass,
+                self._async_tune_in_background(band, station),
+                f"{DOMAIN}_{self.config_entry.entry_id}_station_tune"
             )
+            return
+        if not await self._stations.async_tune(self.data.delivery, self.zone, band, station):
+            raise ServiceValidationError(f"Unable to tune to {station}")
+
+    async def async_join_players(self, group_members: list[str]) -> None:
+        """Group other Arcam Solo players with this one."""
+        members = [self.entity_id]
+        for entity_id in group_members:
+            if entity_id in members:
+                continue
+            if async_get_member_data(self.hass, entity_id) is None:
+                raise ServiceValidationError(f"{entity_id} is not an Arcam Solo media player")
+            members.append(entity_id)
+        for entity_id in members:
+            async_leave_group(self.hass, entity_id)
+        for entity_id in members:
+            async_get_member_data(self.hass, entity_id).group_members = members
+        async_dispatcher_send(self.hass, SIGNAL_GROUP_UPDATED)
+
+    async def async_unjoin_player(self) -> None:
+        """Remove this player from its group."""
+        async_leave_group(self.hass, self.entity_id)
+        async_dispatcher_send(self.hass, SIGNAL_GROUP_UPDATED)
+
+    async def _async_group_call(self, command) -> None:
+        """Run a command on this amp, or on every member when leading a group."""
+        group = self.data.group_members
+        if not group or group[0] != self.entity_id:
+            return await command(self.data)
+        results = await async_fan_out(self.hass, list(group), command)
+        if results.get(self.entity_id) is not None:
+            raise HomeAssistantError(f"Command failed: {results[self.entity_id]}")
@@ -0,0 +1,24 @@
+"""Runtime data for Arcam Solo."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from pyarcamsolo import ArcamSolo
+
+    from .delivery import ArcamCommandDelivery
+    from .stream import ArcamZoneStream
+    from .watchdog import ArcamLinkWatchdog
+
+@dataclass
+class ArcamSoloData:
+    """Runtime data of an Arcam Solo config entry."""
+
+    amp: ArcamSolo
+    watchdog: ArcamLinkWatchdog
+    stream: ArcamZoneStream
+    delivery: ArcamCommandDelivery
+    setup_timings: dict[str, float] = field(default_factory=dict)
+    group_members: list[str] = field(default_factory=list)
@@ -9,10 +9,10 @@ from homeassistant.core import HomeAssistant
 from homeassistant.const import STATE_UNKNOWN
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.exceptions import ServiceValidationError
-from pyarcamsolo import ArcamSolo
 
 from .const import DOMAIN, CONF_ENABLED_FEATURES, DEFAULT_CONF_ENABLED_FEATURES
 from .device import ArcamSoloDevice
+from .models import ArcamSoloData
 
 async def async_setup_entry(
         hass: HomeAssistant,
@@ -20,24 +20,24 @@ async def async_setup_entry(
         async_add_entities: AddEntitiesCallback
 ) -> None:
     """Set up the Arcam Solo remote."""
-    arcam = hass.data[DOMAIN][config_entry.entry_id]
+    data: ArcamSoloData = hass.data[DOMAIN][config_entry.entry_id]
     entities = []
     if "sound_controls" in config_entry.data.get(CONF_ENABLED_FEATURES, DEFAULT_CONF_ENABLED_FEATURES):
         entities.extend([
                 ArcamFrequencyLevelEntity(
-                    amp=arcam,
+                    data=data,
                     config_entry=config_entry,
                     zone=1,
                     level="Bass"
                 ),
                 ArcamFrequencyLevelEntity(
-                    amp=arcam,
+                    data=data,
                     config_entry=config_entry,
                     zone=1,
                     level="Treble"
                 ),
                 ArcamFrequencyLevelEntity(
-                    amp=arcam,
+                    data=data,
                     config_entry=config_entry,
                     zone=1,
                     level="Balance"
@@ -47,7 +47,7 @@ async def async_setup_entry(
     if "display_controls" in config_entry.data.get(CONF_ENABLED_FEATURES, DEFAULT_CONF_ENABLED_FEATURES):
         entities.extend([
                 ArcamDisplayBrightnessEntity(
-                    amp=arcam,
+                    data=data,
                     config_entry=config_entry,
                     zone=1,
                     key="standby_display_brightness",
@@ -55,7 +55,7 @@ async def async_setup_entry(
                     command="stby_display_brightness"
                 ),
                 ArcamDisplayBrightnessEntity(
-                    amp=arcam,
+                    data=data,
                     config_entry=config_entry,
                     zone=1,
                     key="display_brightness",
@@ -67,7 +67,7 @@ async def async_setup_entry(
     if "radio_controls" in config_entry.data.get(CONF_ENABLED_FEATURES, DEFAULT_CONF_ENABLED_FEATURES):
         entities.append(
             ArcamNumberTunerEntity(
-                amp=arcam,
+                data=data,
                 config_entry=config_entry,
                 zone=1 # multi-zone not supported yet
             )
@@ -80,7 +80,7 @@ class ArcamFrequencyLevelEntity(ArcamSoloDevice, NumberEntity):
     _attr_mode = "slider"
     _attr_has_entity_name = True
 
-    def __init__(self, amp: ArcamSolo, config_entry: ConfigEntry, zone: int, level: str) -> None:
+    def __init__(self, data: ArcamSoloData, config_entry: ConfigEntry, zone: int, level: str) -> None:
         """Initialize the Arcam Solo."""
         self._attr_name = f"{level} Level"
         self._level = level
@@ -94,12 +94,8 @@ class ArcamFrequencyLevelEntity(ArcamSoloDevice, NumberEntity):
             self._attr_native_min_value = -14
             self._attr_native_unit_of_measurement = "dB"
             self._attr_device_class = NumberDeviceClass.SOUND_PRESSURE
-        super().__init__(amp, config_entry, zone)
-
-    @property
-    def unique_id(self) -> str:
-        """Return entity unique ID."""
-        return f"{self.config_entry.entry_id}-{self.zone}-number-{self._level.lower()}"
+        super().__init__(data, config_entry, zone)
+        self._attr_unique_id = f"{config_entry.entry_id}-{zone}-number-{level.lower()}"
 
     @property
     def native_value(self) -> float:
@@ -113,17 +109,21 @@ class ArcamFrequencyLevelEntity(ArcamSoloDevice, NumberEntity):
         if value % self._attr_native_step > 0:
             raise ServiceValidationError(f"Only multiples of {self._attr_native_step} are supported for this entity.")
         # apply offset of 100, halve for entities that only support multiples of two.
-        value = (value / self._attr_native_step)+100
-        await self.amp.send_raw_command(
+        raw = (value / self._attr_native_step)+100
+        await self.data.delivery.async_set_level(
             command=self._level.lower(),
             data=[
-                int(value).to_bytes(byteorder='big', signed=True)
-            ]
+                int(raw).to_bytes(byteorder='big', signed=True)
+            ],
+            key=self._level.lower(),
+            value=value
         )
 
     @property
     def available(self) -> bool:
         """Return if the entity is currently available."""
+        if not super().available:
+            return False
         state = self.amp.zones.get(self.zone)
         if state is None:
             return False
@@ -137,21 +137,14 @@ class ArcamNumberTunerEntity(ArcamSoloDevice, NumberEntity):
     """Number entity for tuner frequency."""
 
     _attr_has_entity_name = True
+    _attr_name = "Radio Frequency"
+    _attr_device_class = NumberDeviceClass.FREQUENCY
+    _attr_mode = "slider"
 
-    @property
-    def unique_id(self) -> str:
-        """Return entity unique ID."""
-        return f"{self.config_entry.entry_id}-{self.zone}-number-tuner"
-
-    @property
-    def name(self) -> str:
-        """Return entity name."""
-        return "Radio Frequency"
-
-    @property
-    def device_class(self) -> NumberDeviceClass:
-        """Return the type of device this is."""
-        return NumberDeviceClass.FREQUENCY
+    def __init__(self, data: ArcamSoloData, config_entry: ConfigEntry, zone: int) -> None:
+        """Initialize the Arcam Solo."""
+        super().__init__(data, config_entry, zone)
+        self._attr_unique_id = f"{config_entry.entry_id}-{zone}-number-tuner"
 
     @property
     def native_unit_of_measurement(self) -> str:
@@ -203,15 +196,10 @@ class ArcamNumberTunerEntity(ArcamSoloDevice, NumberEntity):
         if self.source == "FM":
             return 0.05
 
-    @property
-    def mode(self) -> str:
-        """Entity display mode."""
-        return "slider"
-
     @property
     def available(self) -> bool:
         """Return entity availability."""
-        return self.source in ["AM", "FM"]
+        return super().available and self.source in ["AM", "FM"]
 
     @property
     def extra_state_attributes(self) -> dict:
@@ -251,26 +239,24 @@ class ArcamDisplayBrightnessEntity(ArcamSoloDevice, NumberEntity):
 
     def __init__(
             self,
-            amp: ArcamSolo,
+            data: ArcamSoloData,
             config_entry: ConfigEntry,
             zone: int,
             key: str,
             name: str,
             command: str) -> None:
         """Initialize the Arcam Solo."""
-        super().__init__(amp, config_entry, zone)
+        super().__init__(data, config_entry, zone)
         self._key = key
         self._command = command
         self._attr_name = name
-
-    @property
-    def unique_id(self) -> str:
-        """Return entity unique ID."""
-        return f"{self.config_entry.entry_id}-{self.zone}-number-{self._key}"
+        self._attr_unique_id = f"{config_entry.entry_id}-{zone}-number-{key}"
 
     @property
     def available(self) -> bool:
         """Return if the entity is currently available."""
+        if not super().available:
+            return False
         state = self.amp.zones.get(self.zone)
         if state is None:
             return False
@@ -304,7 +290,9 @@ class ArcamDisplayBrightnessEntity(ArcamSoloDevice, NumberEntity):
 
     async def async_set_native_value(self, value: float) -> None:
         """Set the entity value."""
-        await self.amp.send_raw_command(
+        await self.data.delivery.async_set_level(
             command=self._command,
-            data=[int(value).to_bytes()]
+            data=[int(value).to_bytes()],
+            key=self._key,
+            value=int(value)
         )
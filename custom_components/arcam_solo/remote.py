@@ -12,8 +12,11 @@ from homeassistant.const import STATE_UNKNOWN, CONF_NAME
 from homeassistant.exceptions import ServiceValidationError
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
+from pyarcamsolo.commands import IR_COMMAND_CODES
+
 from .const import DOMAIN, CONF_ENABLED_FEATURES, DEFAULT_CONF_ENABLED_FEATURES
 from .device import ArcamSoloDevice
+from .models import ArcamSoloData
 
 async def async_setup_entry(
         hass: HomeAssistant,
@@ -21,12 +24,12 @@ async def async_setup_entry(
         async_add_entities: AddEntitiesCallback
 ) -> None:
     """Set up the Arcam Solo remote."""
-    arcam = hass.data[DOMAIN][config_entry.entry_id]
+    data: ArcamSoloData = hass.data[DOMAIN][config_entry.entry_id]
     if "virtual_remote" in config_entry.data.get(CONF_ENABLED_FEATURES, DEFAULT_CONF_ENABLED_FEATURES):
         async_add_entities(
             [
                 ArcamRemoteEntity(
-                    amp=arcam,
+                    data=data,
                     config_entry=config_entry,
                     zone=1 # multi-zone not supported yet
                 )
@@ -39,6 +42,11 @@ class ArcamRemoteEntity(ArcamSoloDevice, RemoteEntity):
     _attr_has_entity_name = True
     _attr_name = None
 
+    def __init__(self, data: ArcamSoloData, config_entry: ConfigEntry, zone: int) -> None:
+        """Initialize the Arcam Solo remote."""
+        super().__init__(data, config_entry, zone)
+        self._attr_unique_id = f"{config_entry.entry_id}-{zone}-remote"
+
     @property
     def is_on(self) -> bool:
         """Return true if device on."""
@@ -49,23 +57,19 @@ class ArcamRemoteEntity(ArcamSoloDevice, RemoteEntity):
             return STATE_UNKNOWN
         return state["power"] != "Standby"
 
-    @property
-    def unique_id(self) -> str:
-        """Unique ID of the entity."""
-        return f"{self.config_entry.entry_id}-{self.zone}-remote"
-
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Turn the device on."""
-        await self.amp.turn_on()
+        await self.data.delivery.async_turn_on()
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Turn the device off."""
-        await self.amp.turn_off()
+        await self.data.delivery.async_turn_off()
 
     async def async_send_command(self, command: Iterable[str], **kwargs: Any) -> None:
         """Send a command to the device."""
+        command = list(command)
+        for com in command:
+            if com not in IR_COMMAND_CODES:
+                raise ServiceValidationError(f"Unknown IR command {com}")
         for com in command:
-            try:
-                await self.amp.send_ir_command(command=com)
-            except ValueError as err:
-                raise ServiceValidationError(err) from err
+            await self.data.delivery.async_send_ir(com)
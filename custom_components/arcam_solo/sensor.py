@@ -0,0 +1,158 @@
+"""Listening statistics sensors for Arcam Solo."""
+
+from __future__ import annotations
+
+from pyarcamsolo.commands import SOURCE_SELECTION_CODES
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.components.sensor import SensorDeviceClass, SensorEntity, SensorStateClass
+from homeassistant.const import UnitOfTime
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+
+from .const import DOMAIN, CONF_ENABLED_FEATURES, DEFAULT_CONF_ENABLED_FEATURES
+from .device import ArcamSoloDevice
+from .models import ArcamSoloData
+from .statistics import ArcamListeningStats
+
+async def async_setup_entry(
+        hass: HomeAssistant,
+        config_entry: ConfigEntry,
+        async_add_entities: AddEntitiesCallback
+) -> None:
+    """Set up the Arcam Solo listening statistics."""
+    if "listening_statistics" not in config_entry.data.get(CONF_ENABLED_FEATURES, DEFAULT_CONF_ENABLED_FEATURES):
+        return
+    data: ArcamSoloData = hass.data[DOMAIN][config_entry.entry_id]
+    stats = ArcamListeningStats(hass, config_entry.entry_id, data.amp, zone=1)
+    await stats.async_load()
+    stats.async_start()
+    config_entry.async_on_unload(stats.async_stop)
+    sources = sorted({source for source in SOURCE_SELECTION_CODES.values() if source != "N/A"})
+    entities: list[ArcamStatisticSensor] = [
+        ArcamOnTimeSensor(data, config_entry, 1, stats),
+        ArcamAverageVolumeSensor(data, config_entry, 1, stats),
+        ArcamCdTracksSensor(data, config_entry, 1, stats)
+    ]
+    entities.extend(ArcamSourceTimeSensor(data, config_entry, 1, stats, source) for source in sources)
+    async_add_entities(entities)
+
+class ArcamStatisticSensor(ArcamSoloDevice, SensorEntity):
+    """Base for sensors kept by ArcamListeningStats.
+
+    State is only written when the statistics change, not on every zone
+    update, and stays available while the amp is offline.
+    """
+
+    def __init__(self,
+                 data: ArcamSoloData,
+                 config_entry: ConfigEntry,
+                 zone: int,
+                 stats: ArcamListeningStats) -> None:
+        """Initialize the sensor."""
+        super().__init__(data, config_entry, zone)
+        self._stats = stats
+
+    async def async_added_to_hass(self) -> None:
+        """Write state when the statistics change."""
+        self.async_on_remove(
+            async_dispatcher_connect(self.hass, self._stats.signal, self.async_write_ha_state)
+        )
+
+    @property
+    def available(self) -> bool:
+        """Return if the entity is available, statistics always are."""
+        return True
+
+class ArcamOnTimeSensor(ArcamStatisticSensor):
+    """Total time the amp has been on."""
+
+    _attr_name = "Total on time"
+    _attr_icon = "mdi:timer-outline"
+    _attr_device_class = SensorDeviceClass.DURATION
+    _attr_state_class = SensorStateClass.TOTAL_INCREASING
+    _attr_native_unit_of_measurement = UnitOfTime.HOURS
+    _attr_suggested_display_precision = 1
+
+    def __init__(self,
+                 data: ArcamSoloData,
+                 config_entry: ConfigEntry,
+                 zone: int,
+                 stats: ArcamListeningStats) -> None:
+        """Initialize the sensor."""
+        super().__init__(data, config_entry, zone, stats)
+        self._attr_unique_id = f"{self.config_entry.entry_id}-{self.zone}-sensor-on-time"
+
+    @property
+    def native_value(self) -> float:
+        """Return the on time in hours."""
+        return round(self._stats.on_seconds / 3600, 3)
+
+class ArcamSourceTimeSensor(ArcamStatisticSensor):
+    """Total time a source has been listened to."""
+
+    _attr_icon = "mdi:import"
+    _attr_device_class = SensorDeviceClass.DURATION
+    _attr_state_class = SensorStateClass.TOTAL_INCREASING
+    _attr_native_unit_of_measurement = UnitOfTime.HOURS
+    _attr_suggested_display_precision = 1
+
+    def __init__(self,
+                 data: ArcamSoloData,
+                 config_entry: ConfigEntry,
+                 zone: int,
+                 stats: ArcamListeningStats,
+                 source: str) -> None:
+        """Initialize the sensor."""
+        super().__init__(data, config_entry, zone, stats)
+        self._source = source
+        self._attr_name = f"{source} listening time"
+        self._attr_unique_id = f"{self.config_entry.entry_id}-{self.zone}-sensor-source-time-{source.lower()}"
+
+    @property
+    def native_value(self) -> float:
+        """Return the listening time of the source in hours."""
+        return round(self._stats.source_seconds.get(self._source, 0.0) / 3600, 3)
+
+class ArcamAverageVolumeSensor(ArcamStatisticSensor):
+    """Time weighted average volume while on."""
+
+    _attr_name = "Average volume"
+    _attr_icon = "mdi:volume-medium"
+    _attr_state_class = SensorStateClass.MEASUREMENT
+
+    def __init__(self,
+                 data: ArcamSoloData,
+                 config_entry: ConfigEntry,
+                 zone: int,
+                 stats: ArcamListeningStats) -> None:
+        """Initialize the sensor."""
+        super().__init__(data, config_entry, zone, stats)
+        self._attr_unique_id = f"{self.config_entry.entry_id}-{self.zone}-sensor-average-volume"
+
+    @property
+    def native_value(self) -> float | None:
+        """Return the average volume (0-72)."""
+        return self._stats.average_volume
+
+class ArcamCdTracksSensor(ArcamStatisticSensor):
+    """Number of CD tracks played."""
+
+    _attr_name = "CD tracks played"
+    _attr_icon = "mdi:disc-player"
+    _attr_state_class = SensorStateClass.TOTAL_INCREASING
+
+    def __init__(self,
+                 data: ArcamSoloData,
+                 config_entry: ConfigEntry,
+                 zone: int,
+                 stats: ArcamListeningStats) -> None:
+        """Initialize the sensor."""
+        super().__init__(data, config_entry, zone, stats)
+        self._attr_unique_id = f"{self.config_entry.entry_id}-{self.zone}-sensor-cd-tracks"
+
+    @property
+    def native_value(self) -> int:
+        """Return the number of CD tracks played."""
+        return self._stats.cd_tracks
@@ -0,0 +1,285 @@
+"""Radio station index for Arcam Solo."""
+
+from __future__ import annotations
+
+import asyncio
+import bisect
+import logging
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.storage import Store
+
+from .const import DOMAIN
+
+if TYPE_CHECKING:
+    from pyarcamsolo import ArcamSolo
+
+    from .delivery import ArcamCommandDelivery
+
+_LOGGER = logging.getLogger(__name__)
+
+STORAGE_VERSION = 1
+SAVE_DELAY = 30
+
+# Zone key holding the tuned station for each radio band.
+STATION_KEYS = {
+    "DAB": "radio_station",
+    "FM": "radio_frequency",
+    "AM": "radio_frequency"
+}
+
+# Queries that make the amp report the tuned station of each band again.
+STATION_QUERIES = {
+    "DAB": ("radio_station", [b'\xF0']),
+    "FM": ("radio_station_info", [b'\xF0', b'\x00']),
+    "AM": ("radio_station_info", [b'\xF0', b'\x00'])
+}
+
+# Only the DAB station list is a closed ring that navigate_up walks through,
+# FM / AM step through every frequency so are built from observed values.
+SCANNABLE_BANDS = ["DAB"]
+
+# Tuning step of each navigate press on the frequency bands (MHz / kHz).
+FREQUENCY_STEPS = {
+    "FM": 0.05,
+    "AM": 9
+}
+
+# Tuned values each frequency band can hold, anything else is a stale
+# reading of the other band as both share radio_frequency.
+FREQUENCY_RANGES = {
+    "FM": (87.5, 108.0),
+    "AM": (522, 1710)
+}
+
+MAX_SCAN_STEPS = 100
+# A walk across the whole FM band, no tune presses more than this
+MAX_TUNE_PRESSES = round((108.0 - 87.5) / 0.05)
+# Walks longer than this run in the background instead of the service call
+MAX_FOREGROUND_PRESSES = 20
+STEP_DELAY = 0.3
+SETTLE_TIMEOUT = 5
+TUNE_ATTEMPTS = 3
+
+def _sort_key(station: Any) -> Any:
+    """Return the sort key for a station."""
+    if isinstance(station, str):
+        return station.casefold()
+    return station
+
+def valid_station(band: str, station: Any) -> bool:
+    """Return if a value can be the tuned station of a band."""
+    if station is None or station == "":
+        return False
+    if band in FREQUENCY_RANGES:
+        low, high = FREQUENCY_RANGES[band]
+        return isinstance(station, int | float) and low <= station <= high
+    return True
+
+class ArcamStationIndex:
+    """Ordered index of radio stations seen on an Arcam Solo.
+
+    Stations are stored in navigate_up order per band. Bands that have not
+    been scanned fall back to sorted order which the tuner uses for DAB.
+    """
+
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        """Initialize the station index."""
+        self._store: Store[dict[str, Any]] = Store(
+            hass, STORAGE_VERSION, f"{DOMAIN}.{entry_id}.stations"
+        )
+        self._bands: dict[str, list] = {}
+        self._scanned: set[str] = set()
+        self.scanning: str | None = None
+
+    async def async_load(self) -> None:
+        """Load the stored index."""
+        data = await self._store.async_load() or {}
+        self._bands = {
+            band: list(stations) for band, stations in data.get("bands", {}).items()
+        }
+        self._scanned = set(data.get("scanned", []))
+
+    def _data_to_save(self) -> dict[str, Any]:
+        """Return the data to store."""
+        return {
+            "bands": self._bands,
+            "scanned": sorted(self._scanned)
+        }
+
+    def async_schedule_save(self) -> None:
+        """Save the index after a delay."""
+        self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+
+    async def async_save(self) -> None:
+        """Save the index now, a reload loads it straight back."""
+        await self._store.async_save(self._data_to_save())
+
+    def stations(self, band: str) -> list:
+        """Return the known stations for a band."""
+        return self._bands.get(band, [])
+
+    def lookup(self, band: str, station_id: str) -> Any:
+        """Return the station of a band matching a media content id."""
+        for station in self.stations(band):
+            if str(station) == station_id:
+                return station
+        return None
+
+    def observe(self, state: dict) -> bool:
+        """Record the currently tuned station, return True if the index changed."""
+        band = state.get("source")
+        key = STATION_KEYS.get(band)
+        if key is None or self.scanning == band:
+            return False
+        station = state.get(key)
+        if not valid_station(band, station):
+            return False
+        stations = self._bands.setdefault(band, [])
+        if station in stations:
+            return False
+        bisect.insort(stations, station, key=_sort_key)
+        return True
+
+    def path(self, band: str, current: Any, target: Any) -> tuple[str, int] | None:
+        """Return the IR command and number of presses to reach a station."""
+        if band in FREQUENCY_STEPS:
+            # Each press moves one frequency step, not one known station
+            if not valid_station(band, current) or not valid_station(band, target):
+                return None
+            presses = round((target - current) / FREQUENCY_STEPS[band])
+            if abs(presses) > MAX_TUNE_PRESSES:
+                return None
+            if presses >= 0:
+                return ("navigate_up", presses)
+            return ("navigate_down", -presses)
+        stations = self.stations(band)
+        if current not in stations or target not in stations:
+            return None
+        count = len(stations)
+        forward = (stations.index(target) - stations.index(current)) % count
+        backward = (stations.index(current) - stations.index(target)) % count
+        if forward <= backward:
+            return ("navigate_up", forward)
+        return ("navigate_down", backward)
+
+    async def async_refresh(self, delivery: ArcamCommandDelivery, zone: int, band: str) -> Any:
+        """Query the tuned station and wait for a value valid for the band.
+
+        The library only refreshes the station in its periodic sweep, so
+        after a source change the zone still holds the previous band's value.
+        Returns None if no valid station was reported in time.
+        """
+        amp = delivery.amp
+        key = STATION_KEYS[band]
+        query, query_data = STATION_QUERIES[band]
+        refreshed = asyncio.Event()
+
+        def _zone_updated() -> None:
+            if valid_station(band, amp.zones.get(zone, {}).get(key)):
+                refreshed.set()
+
+        callback_id = amp.set_zone_callback(zone=zone, callback=_zone_updated)
+        if callback_id is None:
+            return None
+        try:
+            await delivery.async_send(
+                "toggle", lambda: amp.send_raw_command(command=query, data=query_data, zone=zone)
+            )
+            await asyncio.wait_for(refreshed.wait(), SETTLE_TIMEOUT)
+        except TimeoutError:
+            return None
+        finally:
+            amp.set_zone_callback(zone=zone, callback_id=callback_id)
+        return amp.zones.get(zone, {}).get(key)
+
+    async def async_tune(self, delivery: ArcamCommandDelivery, zone: int, band: str, target: Any) -> bool:
+        """Step the tuner to a station using the shortest path.
+
+        Call async_refresh first so the path starts from the station
+        actually tuned.
+        """
+        amp = delivery.amp
+        key = STATION_KEYS[band]
+        query, query_data = STATION_QUERIES[band]
+        for _ in range(TUNE_ATTEMPTS):
+            current = amp.zones.get(zone, {}).get(key)
+            if current == target:
+                return True
+            step = self.path(band, current, target)
+            if step is None:
+                return False
+            command, presses = step
+            _LOGGER.debug("Tuning %s from %s to %s with %s x %s",
+                          band, current, target, presses, command)
+            for _ in range(presses):
+                await _async_step(delivery, zone, command, query, query_data)
+                await asyncio.sleep(STEP_DELAY)
+            await _async_wait_for_station(amp, zone, key, lambda value: value == target)
+        return amp.zones.get(zone, {}).get(key) == target
+
+    async def async_scan(self, delivery: ArcamCommandDelivery, zone: int, band: str) -> None:
+        """Walk the station list with navigate_up to learn its order."""
+        amp = delivery.amp
+        if band not in SCANNABLE_BANDS or self.scanning is not None:
+            return
+        key = STATION_KEYS[band]
+        query, query_data = STATION_QUERIES[band]
+        start = amp.zones.get(zone, {}).get(key)
+        if start is None:
+            return
+        _LOGGER.debug("Scanning %s stations starting from %s", band, start)
+        self.scanning = band
+        ring = [start]
+        current = start
+        try:
+            for _ in range(MAX_SCAN_STEPS):
+                try:
+                    await _async_step(delivery, zone, "navigate_up", query, query_data)
+                except HomeAssistantError as err:
+                    _LOGGER.warning("Stopped %s scan: %s", band, err)
+                    return
+                previous = current
+                current = await _async_wait_for_station(
+                    amp, zone, key, lambda value, previous=previous: value != previous
+                )
+                if current is None or current == previous:
+                    _LOGGER.debug("Station did not change while scanning, stopping")
+                    return
+                if current == start:
+                    break
+                ring.append(current)
+            else:
+                _LOGGER.warning("Stopped %s scan after %s stations", band, MAX_SCAN_STEPS)
+                return
+        finally:
+            self.scanning = None
+        self._bands[band] = ring
+        self._scanned.add(band)
+        self.async_schedule_save()
+        _LOGGER.debug("Scan found %s %s stations", len(ring), band)
+
+async def _async_step(
+        delivery: ArcamCommandDelivery,
+        zone: int,
+        command: str,
+        query: str,
+        query_data: list[bytes]) -> None:
+    """Press a tuner key and query the station it moved to."""
+    await delivery.async_send_ir(command)
+    await delivery.async_send(
+        "toggle", lambda: delivery.amp.send_raw_command(command=query, data=query_data, zone=zone)
+    )
+
+async def _async_wait_for_station(amp: ArcamSolo, zone: int, key: str, predicate) -> Any:
+    """Wait for the tuned station to match a predicate and return it."""
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + SETTLE_TIMEOUT
+    while loop.time() < deadline:
+        value = amp.zones.get(zone, {}).get(key)
+        if predicate(value):
+            return value
+        await asyncio.sleep(0.2)
+    return amp.zones.get(zone, {}).get(key)
@@ -0,0 +1,168 @@
+"""Listening statistics for Arcam Solo."""
+
+from __future__ import annotations
+
+import time
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+from homeassistant.helpers.event import async_track_time_interval
+from homeassistant.helpers.storage import Store
+
+from .const import DOMAIN
+
+if TYPE_CHECKING:
+    from pyarcamsolo import ArcamSolo
+
+STORAGE_VERSION = 1
+SAVE_DELAY = 60
+TICK_INTERVAL = timedelta(minutes=1)
+
+# CD playback states that end the current track, anything else keeps it
+CD_TRACK_RESET_STATES = ["Stopped", "Tray Open / Empty"]
+# Zone keys the statistics are taken from
+SAMPLED_KEYS = ["power", "source", "volume", "cd_playback_state", "lsb_current_track"]
+
+class ArcamListeningStats:
+    """Listening statistics accumulated from zone updates.
+
+    Time is only counted while the amp is connected and on, each sample
+    adds the time since the previous one using the state it held then.
+    Accumulators are stored so they survive restarts and reloads.
+    """
+
+    def __init__(self, hass: HomeAssistant, entry_id: str, amp: ArcamSolo, zone: int) -> None:
+        """Initialize the statistics."""
+        self.hass = hass
+        self.amp = amp
+        self.zone = zone
+        self.signal = f"{DOMAIN}_{entry_id}_statistics"
+        self._store: Store[dict[str, Any]] = Store(
+            hass, STORAGE_VERSION, f"{DOMAIN}.{entry_id}.statistics"
+        )
+        self.on_seconds = 0.0
+        self.source_seconds: dict[str, float] = {}
+        self.volume_seconds = 0.0
+        self.volume_time = 0.0
+        self.cd_tracks = 0
+        self._sampled_at = time.monotonic()
+        self._connected = False
+        self._power_on = False
+        self._source: str | None = None
+        self._volume: int | None = None
+        self._track: int | None = None
+        self._sampled: tuple = ()
+        self._callback_id: str | None = None
+        self._unsub_tick: Any = None
+
+    @property
+    def average_volume(self) -> float | None:
+        """Return the time weighted average volume while on."""
+        if not self.volume_time:
+            return None
+        return round(self.volume_seconds / self.volume_time, 1)
+
+    async def async_load(self) -> None:
+        """Load the stored accumulators."""
+        data = await self._store.async_load() or {}
+        self.on_seconds = data.get("on_seconds", 0.0)
+        self.source_seconds = dict(data.get("source_seconds", {}))
+        self.volume_seconds = data.get("volume_seconds", 0.0)
+        self.volume_time = data.get("volume_time", 0.0)
+        self.cd_tracks = data.get("cd_tracks", 0)
+
+    def _data_to_save(self) -> dict[str, Any]:
+        """Return the data to store."""
+        return {
+            "on_seconds": self.on_seconds,
+            "source_seconds": self.source_seconds,
+            "volume_seconds": self.volume_seconds,
+            "volume_time": self.volume_time,
+            "cd_tracks": self.cd_tracks
+        }
+
+    @callback
+    def async_start(self) -> None:
+        """Start sampling zone updates."""
+        self._sampled_at = time.monotonic()
+        # A track already playing was counted before the restart or reload
+        self._observe(self.amp.zones.get(self.zone, {}), count_tracks=False)
+        self._callback_id = self.amp.set_zone_callback(zone=self.zone, callback=self._async_zone_updated)
+        self._unsub_tick = async_track_time_interval(
+            self.hass,
+            self._async_tick,
+            TICK_INTERVAL,
+            name=f"{DOMAIN} listening statistics",
+            cancel_on_shutdown=True
+        )
+
+    async def async_stop(self) -> None:
+        """Stop sampling and store what has been counted so far."""
+        self._accumulate()
+        if self._unsub_tick is not None:
+            self._unsub_tick()
+            self._unsub_tick = None
+        if self._callback_id is not None:
+            self.amp.set_zone_callback(zone=self.zone, callback_id=self._callback_id)
+            self._callback_id = None
+        # Saved now so a reload does not load older totals
+        await self._store.async_save(self._data_to_save())
+
+    def _accumulate(self) -> None:
+        """Add the time since the last sample to the accumulators."""
+        now = time.monotonic()
+        elapsed = now - self._sampled_at
+        self._sampled_at = now
+        if not self._power_on or not self._connected:
+            return
+        self.on_seconds += elapsed
+        if self._source is not None:
+            self.source_seconds[self._source] = self.source_seconds.get(self._source, 0.0) + elapsed
+        if self._volume is not None:
+            self.volume_seconds += self._volume * elapsed
+            self.volume_time += elapsed
+
+    def _observe(self, state: dict, count_tracks: bool = True) -> bool:
+        """Take the sampled values from a zone state, return if a sensor changed."""
+        power_on = state.get("power") not in (None, "Standby")
+        source = state.get("source")
+        changed = power_on != self._power_on or source != self._source
+        self._connected = self.amp.available
+        self._power_on = power_on
+        self._source = source
+        self._volume = state.get("volume")
+        playback = state.get("cd_playback_state")
+        track = state.get("lsb_current_track")
+        if source != "CD" or playback in CD_TRACK_RESET_STATES:
+            self._track = None
+        elif playback == "Playing" and track is not None and track != self._track:
+            self._track = track
+            if count_tracks:
+                self.cd_tracks += 1
+                changed = True
+        return changed
+
+    @callback
+    def _async_zone_updated(self) -> None:
+        """Sample a zone update."""
+        state = self.amp.zones.get(self.zone, {})
+        sampled = (self.amp.available, *(state.get(key) for key in SAMPLED_KEYS))
+        if sampled == self._sampled:
+            # Most updates (track position, radio text) leave the statistics alone
+            return
+        self._sampled = sampled
+        self._accumulate()
+        if self._observe(state):
+            self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+            async_dispatcher_send(self.hass, self.signal)
+
+    @callback
+    def _async_tick(self, _now: datetime) -> None:
+        """Advance the accumulators while the amp is on."""
+        if not self._power_on:
+            return
+        self._accumulate()
+        self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+        async_dispatcher_send(self.hass, self.signal)
@@ -0,0 +1,140 @@
+"""Zone change stream for Arcam Solo."""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Callable
+from datetime import datetime, timedelta
+from functools import partial
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.event import async_track_time_interval
+
+from .const import DATA_STREAM_SEQ, DOMAIN, EVENT_ZONE_CHANGED, ZONE_DISCOVERY_INTERVAL
+
+if TYPE_CHECKING:
+    from pyarcamsolo import ArcamSolo
+
+_LOGGER = logging.getLogger(__name__)
+
+class ArcamZoneStream:
+    """Publish only the changed keys of a zone with a sequence number.
+
+    Consumers take a snapshot, then apply deltas with a higher sequence
+    number. The sequence number is shared by all zones of the entry and
+    carries on across reloads, subscribers are ended when the stream stops.
+    """
+
+    def __init__(
+            self,
+            hass: HomeAssistant,
+            entry_id: str,
+            amp: ArcamSolo,
+            fire_events: bool) -> None:
+        """Initialize the zone stream."""
+        self.hass = hass
+        self.amp = amp
+        self.seq = hass.data.get(DATA_STREAM_SEQ, {}).get(entry_id, 0)
+        self._entry_id = entry_id
+        self._fire_events = fire_events
+        self._last: dict[int, dict[str, Any]] = {}
+        self._callback_ids: dict[int, Any] = {}
+        # subscriber -> called once when the stream stops
+        self._subscribers: dict[Callable[[dict[str, Any]], None], Callable[[], None]] = {}
+        self._unsub_discovery: Callable[[], None] | None = None
+
+    @callback
+    def async_start(self) -> None:
+        """Start following zone updates."""
+        for zone, state in self.amp.zones.items():
+            self._last[zone] = dict(state)
+            self._async_follow(zone)
+        self._unsub_discovery = async_track_time_interval(
+            self.hass,
+            self._async_discover_zones,
+            timedelta(seconds=ZONE_DISCOVERY_INTERVAL),
+            name=f"{DOMAIN}_{self._entry_id}_zone_discovery",
+            cancel_on_shutdown=True
+        )
+
+    @callback
+    def async_stop(self) -> None:
+        """Stop following zone updates and end subscriptions."""
+        if self._unsub_discovery is not None:
+            self._unsub_discovery()
+            self._unsub_discovery = None
+        for zone, callback_id in self._callback_ids.items():
+            self.amp.set_zone_callback(zone=zone, callback_id=callback_id)
+        self._callback_ids = {}
+        self.hass.data.setdefault(DATA_STREAM_SEQ, {})[self._entry_id] = self.seq
+        subscribers, self._subscribers = self._subscribers, {}
+        for on_stop in subscribers.values():
+            on_stop()
+
+    @callback
+    def async_subscribe(
+            self,
+            subscriber: Callable[[dict[str, Any]], None],
+            on_stop: Callable[[], None]) -> Callable[[], None]:
+        """Subscribe to zone deltas, return a function to unsubscribe."""
+        self._subscribers[subscriber] = on_stop
+
+        @callback
+        def _unsubscribe() -> None:
+            self._subscribers.pop(subscriber, None)
+
+        return _unsubscribe
+
+    @callback
+    def _async_follow(self, zone: int) -> None:
+        """Register for the updates of a zone."""
+        callback_id = self.amp.set_zone_callback(
+            zone=zone, callback=partial(self._handle_zone_update, zone)
+        )
+        if callback_id is not None:
+            self._callback_ids[zone] = callback_id
+
+    @callback
+    def _async_discover_zones(self, _now: datetime | None = None) -> None:
+        """Follow zones the amp reported after the stream started."""
+        for zone in self.amp.zones:
+            if zone not in self._callback_ids:
+                self._async_follow(zone)
+                # Publish everything the new zone already holds
+                self._handle_zone_update(zone)
+
+    @callback
+    def async_snapshot(self, zone: int) -> dict[str, Any]:
+        """Return the full state of a zone with the current sequence number."""
+        return {
+            "entry_id": self._entry_id,
+            "zone": zone,
+            "seq": self.seq,
+            "state": dict(self._last.get(zone, {}))
+        }
+
+    def _handle_zone_update(self, zone: int) -> None:
+        """Publish the keys that changed since the last update."""
+        if len(self.amp.zones) != len(self._callback_ids):
+            self._async_discover_zones()
+        state = self.amp.zones.get(zone, {})
+        last = self._last.setdefault(zone, {})
+        changed = {
+            key: value for key, value in state.items()
+            if key not in last or last[key] != value
+        }
+        if not changed:
+            return
+        last.update(changed)
+        self.seq += 1
+        delta = {
+            "entry_id": self._entry_id,
+            "zone": zone,
+            "seq": self.seq,
+            "changed": changed
+        }
+        for subscriber in list(self._subscribers):
+            subscriber(delta)
+        if self._fire_events:
+            self.hass.bus.async_fire(EVENT_ZONE_CHANGED, delta)
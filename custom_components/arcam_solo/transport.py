@@ -0,0 +1,186 @@
+"""Shared connection registry for Arcam Solo."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import random
+import time
+from datetime import datetime
+from typing import Any
+from urllib.parse import urlparse
+
+from homeassistant.core import HassJob, HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
+
+from pyarcamsolo import ArcamSolo
+
+from .capture import CapturingArcamSolo, FrameCaptureWriter
+from .const import CONNECT_SPACING, DATA_TRANSPORTS, MAX_CONCURRENT_CONNECTS, PARK_TIMEOUT
+
+_LOGGER = logging.getLogger(__name__)
+
+def transport_host(uri: str) -> str:
+    """Return the host (or serial device) a connection URI points at."""
+    parsed = urlparse(uri)
+    return parsed.hostname or uri
+
+@callback
+def async_get_transport_registry(hass: HomeAssistant) -> ArcamTransportRegistry:
+    """Return the integration wide transport registry."""
+    if DATA_TRANSPORTS not in hass.data:
+        hass.data[DATA_TRANSPORTS] = ArcamTransportRegistry(hass)
+    return hass.data[DATA_TRANSPORTS]
+
+class ArcamTransportRegistry:
+    """Share connections by URI and pace connection attempts per host.
+
+    Many amps are often attached through one serial device server, which
+    will throttle a burst of connections. Attempts to the same host are
+    spaced CONNECT_SPACING seconds apart with at most
+    MAX_CONCURRENT_CONNECTS in flight.
+
+    Connections released by an unloading entry are parked for PARK_TIMEOUT
+    seconds so a reload of the same entry picks the live connection back up.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the registry."""
+        self.hass = hass
+        self._transports: dict[str, ArcamSolo] = {}
+        self._refs: dict[str, int] = {}
+        self._uri_locks: dict[str, asyncio.Lock] = {}
+        self._host_locks: dict[str, asyncio.Lock] = {}
+        self._host_slots: dict[str, asyncio.Semaphore] = {}
+        self._host_state: dict[str, dict[str, Any]] = {}
+        # entry_id -> (uri, cancel release)
+        self._parked: dict[str, tuple[str, Any]] = {}
+
+    def _state(self, host: str) -> dict[str, Any]:
+        """Return the mutable connection state of a host."""
+        return self._host_state.setdefault(host, {
+            "connecting": 0,
+            "connects": 0,
+            "failures": 0,
+            "last_connect": None,
+            "last_error": None
+        })
+
+    async def async_acquire(
+            self,
+            uri: str,
+            scan_interval: int,
+            entry_id: str,
+            capture: FrameCaptureWriter | None = None) -> ArcamSolo:
+        """Return a connected ArcamSolo for a URI, reusing a live one."""
+        if (arcam := await self._async_unpark(entry_id, uri)) is not None:
+            arcam.scan_interval = scan_interval
+            return arcam
+        async with self._uri_locks.setdefault(uri, asyncio.Lock()):
+            if uri in self._transports:
+                self._refs[uri] += 1
+                _LOGGER.debug("Reusing connection to %s", uri)
+                return self._transports[uri]
+            if capture is not None:
+                arcam = CapturingArcamSolo(uri=uri, scan_interval=scan_interval, capture=capture)
+            else:
+                arcam = ArcamSolo(uri=uri, scan_interval=scan_interval)
+            try:
+                await self.async_connect(uri, arcam)
+            except Exception:
+                await arcam.shutdown()
+                raise
+            self._transports[uri] = arcam
+            self._refs[uri] = 1
+            return arcam
+
+    async def _async_unpark(self, entry_id: str, uri: str) -> ArcamSolo | None:
+        """Take back the parked connection of an entry if the URI is unchanged."""
+        if entry_id not in self._parked:
+            return None
+        parked_uri, cancel_release = self._parked.pop(entry_id)
+        cancel_release()
+        if parked_uri != uri:
+            await self.async_release(parked_uri)
+            return None
+        # A parked connection stays open, so the library keeps its zones current
+        _LOGGER.debug("Reusing parked connection to %s", uri)
+        return self._transports[uri]
+
+    @callback
+    def async_park(self, entry_id: str, uri: str) -> None:
+        """Hold a released connection briefly so a reload can reuse it."""
+        async def _async_release(_now: datetime) -> None:
+            if self._parked.get(entry_id, (None,))[0] == uri:
+                self._parked.pop(entry_id)
+                await self.async_release(uri)
+
+        self._parked[entry_id] = (
+            uri,
+            async_call_later(
+                self.hass,
+                PARK_TIMEOUT,
+                HassJob(_async_release, cancel_on_shutdown=True)
+            )
+        )
+
+    async def async_discard(self, entry_id: str) -> None:
+        """Release the parked connection of a removed entry straight away."""
+        if entry_id in self._parked:
+            uri, cancel_release = self._parked.pop(entry_id)
+            cancel_release()
+            await self.async_release(uri)
+
+    async def async_release(self, uri: str) -> None:
+        """Release a connection, shutting it down once unused."""
+        async with self._uri_locks.setdefault(uri, asyncio.Lock()):
+            self._refs[uri] -= 1
+            if self._refs[uri] > 0:
+                return
+            self._refs.pop(uri)
+            arcam = self._transports.pop(uri)
+            if isinstance(arcam, CapturingArcamSolo):
+                # Frames recorded while parked are past the entry's last flush
+                await self.hass.async_add_executor_job(arcam.capture.flush)
+            await arcam.shutdown()
+
+    async def async_connect(self, uri: str, arcam: ArcamSolo) -> None:
+        """Connect an ArcamSolo, pacing attempts against the same host."""
+        host = transport_host(uri)
+        state = self._state(host)
+        async with self._host_slots.setdefault(host, asyncio.Semaphore(MAX_CONCURRENT_CONNECTS)):
+            async with self._host_locks.setdefault(host, asyncio.Lock()):
+                if state["last_connect"] is not None:
+                    wait = state["last_connect"] + CONNECT_SPACING - time.monotonic()
+                    if wait > 0:
+                        await asyncio.sleep(wait + random.uniform(0, CONNECT_SPACING / 4))
+                state["last_connect"] = time.monotonic()
+            state["connecting"] += 1
+            try:
+                await arcam.connect(reconnect=False)
+            except Exception as exc:
+                state["failures"] += 1
+                state["last_error"] = f"{type(exc).__name__}: {exc}"
+                raise
+            else:
+                state["connects"] += 1
+            finally:
+                state["connecting"] -= 1
+
+    @callback
+    def async_host_state(self, host: str) -> dict[str, Any]:
+        """Return the connection state of a host for diagnostics."""
+        state = self._state(host)
+        transports = {
+            uri: arcam for uri, arcam in self._transports.items()
+            if transport_host(uri) == host
+        }
+        return {
+            "transports": len(transports),
+            "connected": sum(1 for arcam in transports.values() if arcam.available),
+            "connecting": state["connecting"],
+            "connects": state["connects"],
+            "failures": state["failures"],
+            "parked": sum(1 for uri, _ in self._parked.values() if transport_host(uri) == host),
+            "last_error": state["last_error"]
+        }
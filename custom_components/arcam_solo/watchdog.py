@@ -0,0 +1,162 @@
+"""Connection watchdog for Arcam Solo."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import random
+import time
+from collections.abc import Awaitable, Callable
+from datetime import datetime, timedelta
+from functools import partial
+from typing import TYPE_CHECKING
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+from homeassistant.helpers.event import async_call_later, async_track_time_interval
+
+from .const import DOMAIN, AVAILABILITY_GRACE
+
+if TYPE_CHECKING:
+    from pyarcamsolo import ArcamSolo
+
+_LOGGER = logging.getLogger(__name__)
+
+RECONNECT_DELAY_BASE = 0.5
+RECONNECT_DELAY_MAX = 30
+
+class ArcamLinkWatchdog:
+    """Detect dead links and hold availability through short drops.
+
+    Any update received from the amp counts as a heartbeat, a status
+    query is sent when the link has been quiet for a third of the timeout.
+    """
+
+    def __init__(
+            self,
+            hass: HomeAssistant,
+            entry_id: str,
+            amp: ArcamSolo,
+            timeout: int,
+            connect: Callable[[], Awaitable[None]] | None = None) -> None:
+        """Initialize the watchdog."""
+        self.hass = hass
+        self.amp = amp
+        # The library reconnect loop is left off, the watchdog owns reconnects
+        self._connect = connect or partial(amp.connect, reconnect=False)
+        self.timeout = timeout
+        self.available = amp.available
+        self.signal = f"{DOMAIN}_{entry_id}_availability"
+        self._entry_id = entry_id
+        self._last_seen = time.monotonic()
+        self._callback_id = None
+        self._unsub_heartbeat = None
+        self._unsub_grace = None
+        self._reconnect_task: asyncio.Task | None = None
+
+    @callback
+    def async_start(self) -> None:
+        """Start watching the connection."""
+        self._last_seen = time.monotonic()
+        self._callback_id = self.amp.set_zone_callback(zone=1, callback=self._handle_zone_update)
+        self._unsub_heartbeat = async_track_time_interval(
+            self.hass,
+            self._async_heartbeat,
+            timedelta(seconds=max(self.timeout / 3, 1)),
+            name=f"{DOMAIN}_{self._entry_id}_heartbeat",
+            cancel_on_shutdown=True
+        )
+
+    @callback
+    def async_stop(self) -> None:
+        """Stop watching the connection."""
+        if self._callback_id is not None:
+            self.amp.set_zone_callback(zone=1, callback_id=self._callback_id)
+            self._callback_id = None
+        if self._unsub_heartbeat is not None:
+            self._unsub_heartbeat()
+            self._unsub_heartbeat = None
+        if self._unsub_grace is not None:
+            self._unsub_grace()
+            self._unsub_grace = None
+        if self._reconnect_task is not None:
+            self._reconnect_task.cancel()
+            self._reconnect_task = None
+
+    @callback
+    def _handle_zone_update(self) -> None:
+        """Record that the amp is still talking to us."""
+        if self.amp.available:
+            self._last_seen = time.monotonic()
+        else:
+            self._async_schedule_reconnect()
+        self._async_update_available()
+
+    async def _async_heartbeat(self, _now: datetime) -> None:
+        """Check the link is still alive."""
+        if self._callback_id is None and 1 in self.amp.zones:
+            self._callback_id = self.amp.set_zone_callback(zone=1, callback=self._handle_zone_update)
+        self._async_update_available()
+        if not self.amp.available:
+            self._async_schedule_reconnect()
+            return
+        idle = time.monotonic() - self._last_seen
+        if idle >= self.timeout:
+            _LOGGER.warning("No response from Arcam Solo for %.0fs, reconnecting", idle)
+            await self.amp.disconnect()
+            self._async_update_available()
+            self._async_schedule_reconnect()
+            return
+        if idle >= self.timeout / 3:
+            try:
+                await self.amp.send_raw_command(command="status", data=[b'\xF0'])
+            except (OSError, RuntimeError) as exc:
+                _LOGGER.debug("Heartbeat query failed: %s", exc)
+
+    @callback
+    def _async_schedule_reconnect(self) -> None:
+        """Start reconnecting if not already doing so."""
+        if self._reconnect_task is None or self._reconnect_task.done():
+            self._reconnect_task = self.hass.async_create_background_task(
+                self._async_reconnect(),
+                f"{DOMAIN}_{self._entry_id}_reconnect"
+            )
+
+    async def _async_reconnect(self) -> None:
+        """Reconnect straight away, backing off with jitter on failure."""
+        attempt = 0
+        while not self.amp.available:
+            await asyncio.sleep(
+                random.uniform(0, min(RECONNECT_DELAY_MAX, RECONNECT_DELAY_BASE * 2 ** attempt))
+            )
+            attempt += 1
+            try:
+                await self._connect()
+            except (OSError, RuntimeError, TimeoutError) as exc:
+                _LOGGER.debug("Reconnect attempt %s failed: %s", attempt, exc)
+        self._last_seen = time.monotonic()
+        _LOGGER.debug("Reconnected after %s attempts", attempt)
+        self._async_update_available()
+
+    @callback
+    def _async_update_available(self) -> None:
+        """Update availability, only dropping it after the grace period."""
+        if self.amp.available:
+            if self._unsub_grace is not None:
+                self._unsub_grace()
+                self._unsub_grace = None
+            if not self.available:
+                self.available = True
+                async_dispatcher_send(self.hass, self.signal)
+        elif self.available and self._unsub_grace is None:
+            self._unsub_grace = async_call_later(
+                self.hass, AVAILABILITY_GRACE, self._async_grace_expired
+            )
+
+    @callback
+    def _async_grace_expired(self, _now: datetime) -> None:
+        """Mark entities unavailable if the link did not come back."""
+        self._unsub_grace = None
+        if not self.amp.available and self.available:
+            self.available = False
+            async_dispatcher_send(self.hass, self.signal)
@@ -0,0 +1,53 @@
+"""Websocket API for Arcam Solo."""
+
+from __future__ import annotations
+
+from typing import Any
+
+import voluptuous as vol
+
+from homeassistant.components import websocket_api
+from homeassistant.core import HomeAssistant, callback
+
+from .const import DOMAIN
+
+@callback
+def async_register_websocket_commands(hass: HomeAssistant) -> None:
+    """Register the websocket commands."""
+    websocket_api.async_register_command(hass, ws_subscribe_zone)
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): f"{DOMAIN}/subscribe_zone",
+        vol.Required("entry_id"): str,
+        vol.Optional("zone", default=1): int
+    }
+)
+@callback
+def ws_subscribe_zone(
+        hass: HomeAssistant,
+        connection: websocket_api.ActiveConnection,
+        msg: dict[str, Any]
+) -> None:
+    """Send a zone snapshot followed by the changed keys of each update."""
+    data = hass.data.get(DOMAIN, {}).get(msg["entry_id"])
+    if data is None:
+        connection.send_error(msg["id"], websocket_api.ERR_NOT_FOUND, "Config entry not loaded")
+        return
+    zone = msg["zone"]
+
+    @callback
+    def _forward_delta(delta: dict[str, Any]) -> None:
+        if delta["zone"] == zone:
+            connection.send_message(websocket_api.event_message(msg["id"], delta))
+
+    @callback
+    def _end_subscription() -> None:
+        connection.subscriptions.pop(msg["id"], None)
+        connection.send_error(msg["id"], websocket_api.ERR_NOT_FOUND, "Config entry unloaded")
+
+    connection.subscriptions[msg["id"]] = data.stream.async_subscribe(_forward_delta, _end_subscription)
+    connection.send_result(msg["id"])
+    connection.send_message(
+        websocket_api.event_message(msg["id"], data.stream.async_snapshot(zone))
+    )